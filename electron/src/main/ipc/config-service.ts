@@ -36,6 +36,8 @@ export interface Config {
     provider: string
     api_key: string | null
     model: string | null
+    max_output_tokens: number | null
+    cache: boolean
   }
 }
 
@@ -219,7 +221,7 @@ function getDefaultConfig(): Config {
       model: 'large-v3-turbo',
       backend: 'local',
       device: 'auto',
-      compute_type: 'int8',
+      compute_type: 'auto',
       beam_size: 5,
       language: null,
       initial_prompt: null
@@ -244,7 +246,9 @@ function getDefaultConfig(): Config {
     summarize: {
       provider: 'gemini',
       api_key: null,
-      model: null
+      model: null,
+      max_output_tokens: null,
+      cache: true
     }
   }
 }
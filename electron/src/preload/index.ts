@@ -71,6 +71,8 @@ export interface Config {
     provider: string
     api_key: string | null
     model: string | null
+    max_output_tokens: number | null
+    cache: boolean
   }
 }
 
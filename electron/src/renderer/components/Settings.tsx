@@ -285,7 +285,9 @@ export function Settings({ onClose }: SettingsProps) {
                       }
                       className="w-40"
                     >
+                      <option value="auto">auto</option>
                       <option value="int8">int8</option>
+                      <option value="int8_float16">int8_float16</option>
                       <option value="float16">float16</option>
                       <option value="float32">float32</option>
                     </select>
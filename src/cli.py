@@ -1,27 +1,71 @@
 #!/usr/bin/env python3
 """YT-Comprehend CLI - Video comprehension for LLM consumption."""
 
+import atexit
 import json
 import os
+import queue
+import re
+import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import Future
 from pathlib import Path
 
 import click
 from rich.console import Console
 
-# Add src to path for development
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Optional: orjson serializes the JSON output format several times faster
+try:
+    import orjson
 
-from src.comprehend import VideoComprehend
-from src.extractors.audio import AudioExtractionError
-from src.extractors.captions import CaptionExtractionError
-from src.extractors.gemini_video import GeminiVideoError
-from src.summarize import SummarizationError, summarize_file
+    def _json_dumps(obj) -> bytes:
+        # NumPy scalars can reach the output (segment timings are float64 arrays)
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+# Project root: holds .env, the default config.yaml and the output/ directory
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Add src to path for development (the Electron UI runs `python src/cli.py`)
+sys.path.insert(0, str(_PROJECT_ROOT))
 
 console = Console()
 err_console = Console(stderr=True)
 
+# Filename sanitization: drop punctuation, collapse whitespace/dashes
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w\s-]')
+_FILENAME_SEPARATOR_RE = re.compile(r'[-\s]+')
+
+# Known progress messages -> (stage, percent) for --json-progress; matched in
+# one regex pass (the leftmost hit is the message's leading phrase)
+_STAGE_PROGRESS = {
+    "Trying caption extraction": ("caption", 10),
+    "yt-dlp caption fallback": ("caption", 15),
+    "Captions unavailable": ("caption", 20),
+    "Escalating to Tier 2": ("escalate", 25),
+    "Starting audio transcription": ("transcribe", 30),
+    "Downloading audio": ("download", 40),
+    "Transcribing with": ("transcribe", 60),
+    "Audio transcription failed": ("transcribe", 70),
+    "Escalating to Tier 3": ("escalate", 75),
+    "Starting full visual analysis": ("visual", 80),
+    "Sending video URL to Gemini": ("gemini", 40),
+}
+_STAGE_PROGRESS_RE = re.compile("|".join(map(re.escape, _STAGE_PROGRESS)))
+
+# Auto-generated output layout: output/<tier dir>/transcripts/<title><ext>
+_TIER_DIRS = {
+    1: "tier1-captions",
+    2: "tier2-whisper",
+    3: "tier3-visual",
+    "gemini": "gemini-direct",
+}
+_FORMAT_EXTENSIONS = {"json": ".json", "plain": ".txt", "markdown": ".md"}
+
 
 def _load_project_env():
     """Load the project-root .env into os.environ (existing vars win).
@@ -29,7 +73,7 @@ def _load_project_env():
     Lets API keys (GEMINI_API_KEY etc.) work from any terminal without
     sourcing the file manually - important for agent/script usage.
     """
-    env_path = Path(__file__).parent.parent / ".env"
+    env_path = _PROJECT_ROOT / ".env"
     if not env_path.exists():
         return
     try:
@@ -46,38 +90,136 @@ def _load_project_env():
         pass  # .env is a convenience; never fail on it
 
 
-def _get_safe_filename(video_id: str) -> str:
-    """Get video title and convert to safe filename."""
-    import re
-    import subprocess
+def _fetch_title(video_id: str) -> str | None:
+    """Fetch a video's title via yt-dlp (None on failure).
 
+    Runs yt-dlp in-process; the `yt-dlp` binary is only a fallback for
+    environments where the Python package isn't importable.
+    """
+    url = f"https://youtube.com/watch?v={video_id}"
     try:
-        # Use yt-dlp to get video title
-        result = subprocess.run(
-            ["yt-dlp", "--get-title", "--no-playlist", f"https://youtube.com/watch?v={video_id}"],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            title = result.stdout.strip()
-            # Convert to safe filename: lowercase, replace spaces/special chars with hyphens
-            safe = re.sub(r'[^\w\s-]', '', title.lower())
-            safe = re.sub(r'[-\s]+', '-', safe).strip('-')
-            # Limit length
-            if len(safe) > 60:
-                safe = safe[:60].rsplit('-', 1)[0]
-            return safe
+        from yt_dlp import YoutubeDL
+    except ImportError:
+        try:
+            result = subprocess.run(
+                ["yt-dlp", "--get-title", "--no-playlist", url],
+                capture_output=True,
+                text=True,
+                timeout=30,
+            )
+        except Exception:
+            return None
+        if result.returncode != 0:
+            return None
+        return result.stdout.strip() or None
+
+    from src.utils import SilentLogger
+
+    options = {
+        "quiet": True,
+        "no_warnings": True,
+        "skip_download": True,
+        "noplaylist": True,
+        "socket_timeout": 30,
+        "logger": SilentLogger(),
+    }
+    try:
+        with YoutubeDL(options) as ydl:
+            return (ydl.extract_info(url, download=False) or {}).get("title") or None
     except Exception:
-        pass
+        return None
+
+
+def _start_title_lookup(video_id: str) -> Future:
+    """Fetch the title on a daemon thread so it overlaps analysis."""
+    future = Future()
+    threading.Thread(
+        target=lambda: future.set_result(_fetch_title(video_id)), daemon=True
+    ).start()
+    return future
+
+
+def _get_safe_filename(metadata, title_lookup: Future | None = None) -> str:
+    """Convert the video title to a safe filename (falls back to the video ID).
+
+    Uses the title the extractor already fetched; otherwise waits on the
+    background lookup started before analysis (or fetches it now).
+    """
+    title = metadata.title
+    if not title:
+        if title_lookup is None:
+            title = _fetch_title(metadata.video_id)
+        else:
+            try:
+                title = title_lookup.result(timeout=60)
+            except TimeoutError:
+                title = None
+
+    if title:
+        # Convert to safe filename: lowercase, replace spaces/special chars with hyphens
+        safe = _UNSAFE_FILENAME_RE.sub('', title.lower())
+        safe = _FILENAME_SEPARATOR_RE.sub('-', safe).strip('-')
+        # Limit length
+        if len(safe) > 60:
+            safe = safe[:60].rsplit('-', 1)[0]
+        return safe
 
     # Fallback to video ID
-    return video_id
+    return metadata.video_id
+
+
+def _print_output(output_bytes: bytes):
+    """Print already-encoded output straight to the stdout byte stream."""
+    sys.stdout.flush()  # Keep ordering with anything already printed as text
+    sys.stdout.buffer.write(output_bytes)
+    if not output_bytes.endswith(b"\n"):
+        sys.stdout.buffer.write(b"\n")
+    sys.stdout.buffer.flush()
 
 
 def progress_callback(message: str):
     """Print progress messages."""
-    console.print(f"[dim]→ {message}[/dim]", highlight=False)
+    # Messages are plain text (often raw tool errors): skip markup parsing and
+    # highlighting so brackets print verbatim and no regex scan runs per line
+    console.print(f"→ {message}", style="dim", markup=False, highlight=False)
+
+
+class _ProgressWriter:
+    """Write JSON progress lines to a stream from a daemon thread.
+
+    A slow consumer (a full stdout pipe) then can't stall extraction on the
+    main thread. Lines keep their order and are drained at interpreter exit.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _drain(self):
+        while (line := self._queue.get()) is not None:
+            try:
+                # One write per event: a split write can split the line
+                # across the consumer's pipe reads
+                self._stream.write(line)
+                self._stream.flush()
+            except (OSError, ValueError):
+                pass  # Consumer went away; keep draining so close() returns
+
+    def write(self, line: str):
+        self._queue.put(line)
+
+    def close(self, timeout: float = 5.0):
+        """Flush queued lines and stop the writer thread (idempotent)."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout)
+
+
+# Set by main() when --json-progress is active
+_progress_writer: _ProgressWriter | None = None
 
 
 def json_progress_event(stage: str, message: str, progress: int = -1, output_path: str | None = None):
@@ -90,36 +232,21 @@ def json_progress_event(stage: str, message: str, progress: int = -1, output_pat
     }
     if output_path:
         event["output_path"] = output_path
-    print(json.dumps(event), flush=True)
+    line = json.dumps(event) + "\n"
+    if _progress_writer is not None:
+        _progress_writer.write(line)
+    else:
+        sys.stdout.write(line)
+        sys.stdout.flush()
 
 
 def make_json_progress_callback():
     """Create a progress callback that emits JSON events."""
-    stage_progress = {
-        "Trying caption extraction": ("caption", 10),
-        "yt-dlp caption fallback": ("caption", 15),
-        "Captions unavailable": ("caption", 20),
-        "Escalating to Tier 2": ("escalate", 25),
-        "Starting audio transcription": ("transcribe", 30),
-        "Downloading audio": ("download", 40),
-        "Transcribing with": ("transcribe", 60),
-        "Audio transcription failed": ("transcribe", 70),
-        "Escalating to Tier 3": ("escalate", 75),
-        "Starting full visual analysis": ("visual", 80),
-        "Sending video URL to Gemini": ("gemini", 40),
-    }
 
     def callback(message: str):
         # Try to match known messages for progress estimation
-        stage = "processing"
-        progress = -1
-
-        for pattern, (s, p) in stage_progress.items():
-            if pattern in message:
-                stage = s
-                progress = p
-                break
-
+        match = _STAGE_PROGRESS_RE.search(message)
+        stage, progress = _STAGE_PROGRESS[match.group(0)] if match else ("processing", -1)
         json_progress_event(stage, message, progress)
 
     return callback
@@ -232,6 +359,18 @@ def make_json_progress_callback():
     default=None,
     help="Model for summarization (default: provider-specific)"
 )
+@click.option(
+    "--max-output-tokens",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Cap on summary tokens generated (default: provider-specific)"
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Generate a fresh summary instead of reusing a cached one"
+)
 @click.option(
     "--llm",
     is_flag=True,
@@ -260,6 +399,8 @@ def main(
     provider: str | None,
     api_key: str | None,
     summarize_model: str | None,
+    max_output_tokens: int | None,
+    no_cache: bool,
     llm: bool,
 ):
     """
@@ -281,6 +422,9 @@ def main(
 
     if llm and json_progress:
         raise click.UsageError("--llm and --json-progress are mutually exclusive")
+
+    global _progress_writer
+    _progress_writer = _ProgressWriter(sys.stdout) if json_progress else None
     if llm:
         summarize = not no_save  # summary needs a saved transcript
         quiet = True  # silence stdout chatter; --llm reports progress on stderr
@@ -289,11 +433,18 @@ def main(
     config_path = config
     if not config_path:
         # Look for config in current dir or project root
-        for candidate in [Path("config.yaml"), Path(__file__).parent.parent / "config.yaml"]:
-            if candidate.exists():
+        for candidate in (Path("config.yaml"), _PROJECT_ROOT / "config.yaml"):
+            if os.path.isfile(candidate):
                 config_path = str(candidate)
                 break
 
+    # Deferred so --help and usage errors don't pay for the extractor stack
+    from src.comprehend import VideoComprehend
+    from src.extractors.audio import AudioExtractionError
+    from src.extractors.captions import CaptionExtractionError, CaptionExtractor
+    from src.extractors.gemini_video import GeminiVideoError
+    from src.summarize import SummarizationError, summarize_file
+
     # Initialize engine
     vc = VideoComprehend(config_path=config_path)
 
@@ -328,17 +479,24 @@ def main(
     elif llm:
         # Keep stdout clean for the summary; progress goes to stderr
         def callback(message: str):
-            err_console.print(f"[dim]→ {message}[/dim]", highlight=False)
+            err_console.print(f"→ {message}", style="dim", markup=False, highlight=False)
     elif quiet:
         callback = None
     else:
         callback = progress_callback
 
+    title_lookup = None
     try:
         if not quiet and not json_progress:
             console.print(f"[bold]Analyzing:[/bold] {url}")
             console.print()
 
+        # Captions (API route) and Gemini don't fetch the title, so look it up
+        # for the auto-generated filename while analysis runs
+        if not output and not no_save:
+            if (resolved_tier or vc.config.get("default_tier", 1)) not in (2, 3):
+                title_lookup = _start_title_lookup(CaptionExtractor.extract_video_id(url))
+
         result = vc.analyze(
             url=url,
             tier=resolved_tier,
@@ -353,9 +511,9 @@ def main(
             console.print(f"[green]✓[/green] Analysis complete (Tier {result.metadata.tier_used})")
             console.print()
 
-        # Format output
+        # Format output, encoded once: the file and stdout share the same bytes
         if output_format == "json":
-            output_text = json.dumps({
+            output_bytes = _json_dumps({
                 "metadata": {
                     "url": result.metadata.url,
                     "video_id": result.metadata.video_id,
@@ -365,20 +523,21 @@ def main(
                 },
                 "transcript": result.transcript_text,
                 "segments": [
-                    {"text": s.text, "start": s.start, "end": getattr(s, 'end', s.start + getattr(s, 'duration', 0))}
+                    {"text": s.text, "start": s.start, "end": s.end}
                     for s in result.transcript_segments
                 ],
                 "visual_text": result.visual_text if result.visual_text else None,
-            }, indent=2)
+            })
         elif output_format == "plain":
             output_text = result.transcript_text
             if result.visual_text:
                 output_text += f"\n\n---\n\n{result.visual_text}"
+            output_bytes = output_text.encode("utf-8")
         else:  # markdown
-            output_text = result.to_markdown(
+            output_bytes = result.to_markdown(
                 include_timestamps=not no_timestamps,
                 timestamp_interval=interval,
-            )
+            ).encode("utf-8")
 
         # Determine output path (save by default unless --no-save)
         output_path = None
@@ -386,32 +545,25 @@ def main(
             output_path = Path(output)
         elif not no_save:
             # Auto-generate path based on tier
-            tier_dirs = {
-                1: "tier1-captions",
-                2: "tier2-whisper",
-                3: "tier3-visual",
-                "gemini": "gemini-direct",
-            }
-            tier_dir = tier_dirs.get(result.metadata.tier_used, "tier1-captions")
+            tier_dir = _TIER_DIRS.get(result.metadata.tier_used, "tier1-captions")
 
             # Use output directory from config, or default
             output_base = Path(vc.config.get("output", {}).get("directory", "./output"))
             if not output_base.is_absolute():
-                output_base = Path(__file__).parent.parent / output_base
-            output_base.mkdir(parents=True, exist_ok=True)
+                output_base = _PROJECT_ROOT / output_base
 
-            # Create tier subdirectories
+            # Create the tier subdirectories (parents=True covers output_base)
             transcript_dir = output_base / tier_dir / "transcripts"
             transcript_dir.mkdir(parents=True, exist_ok=True)
 
             # Get video title for filename
-            filename = _get_safe_filename(result.metadata.video_id)
-            ext = {"json": ".json", "plain": ".txt", "markdown": ".md"}.get(output_format, ".md")
+            filename = _get_safe_filename(result.metadata, title_lookup)
+            ext = _FORMAT_EXTENSIONS.get(output_format, ".md")
             output_path = transcript_dir / f"{filename}{ext}"
 
         # Output: save to file if path set, always print to stdout unless quiet
         if output_path:
-            output_path.write_text(output_text)
+            output_path.write_bytes(output_bytes)
             if json_progress:
                 if summarize:
                     # Don't emit "complete" yet - summarization still pending
@@ -436,14 +588,16 @@ def main(
                 resolved_provider = provider or sum_config.get("provider", "gemini")
                 resolved_key = api_key or sum_config.get("api_key")
                 resolved_model = summarize_model or sum_config.get("model")
+                resolved_max_tokens = max_output_tokens or sum_config.get("max_output_tokens")
+                use_cache = not no_cache and sum_config.get("cache", True)
 
                 def summarize_progress(msg):
                     if json_progress:
                         json_progress_event("summarize", msg, 95)
                     elif llm:
-                        err_console.print(f"[dim]-> {msg}[/dim]", highlight=False)
+                        err_console.print(f"-> {msg}", style="dim", markup=False, highlight=False)
                     elif not quiet:
-                        console.print(f"[dim]-> {msg}[/dim]", highlight=False)
+                        console.print(f"-> {msg}", style="dim", markup=False, highlight=False)
 
                 summary_path = summarize_file(
                     output_path,
@@ -451,6 +605,8 @@ def main(
                     api_key=resolved_key,
                     model=resolved_model,
                     progress_callback=summarize_progress,
+                    max_output_tokens=resolved_max_tokens,
+                    use_cache=use_cache,
                 )
 
                 if json_progress:
@@ -476,15 +632,15 @@ def main(
         # default      -> transcript (unless quiet/-o/--json-progress)
         if llm:
             if summary_path is not None:
-                print(Path(summary_path).read_text())
+                _print_output(Path(summary_path).read_bytes())
             else:
                 if summary_error:
                     err_console.print(
                         "[yellow]Summary unavailable - printing transcript instead[/yellow]"
                     )
-                print(output_text)
+                _print_output(output_bytes)
         elif not quiet and not output and not json_progress:
-            print(output_text)
+            _print_output(output_bytes)
 
     except CaptionExtractionError as e:
         if json_progress:
@@ -512,6 +668,9 @@ def main(
             if not quiet:
                 err_console.print_exception()
         sys.exit(1)
+    finally:
+        if _progress_writer is not None:
+            _progress_writer.close()
 
 
 if __name__ == "__main__":
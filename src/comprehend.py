@@ -3,10 +3,13 @@
 Orchestrates the tiered extraction process and combines results.
 """
 
+import hashlib
+import json
+import os
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
-
-import yaml
+from types import MappingProxyType
 
 from .extractors.audio import AudioExtractionError, AudioExtractor
 from .extractors.captions import (
@@ -14,10 +17,106 @@ from .extractors.captions import (
     CaptionExtractor,
     YtDlpCaptionExtractor,
 )
-from .utils import group_segments_by_interval
+from .utils import CACHE_DIR, group_segments_by_interval
+
+
+def _read_user_config(config_path: Path) -> dict:
+    """Parse a YAML config file, reusing a JSON copy while it is unchanged.
+
+    The cache entry is keyed by the resolved path and invalidated by the
+    file's mtime_ns/size, so edits are picked up on the next run.
+    """
+    stat = config_path.stat()
+    stamp = [stat.st_mtime_ns, stat.st_size]
+    key = hashlib.sha256(str(config_path.resolve()).encode()).hexdigest()[:16]
+    cache_path = CACHE_DIR / f"config-{key}.json"
+
+    try:
+        with open(cache_path, "rb") as f:
+            cached = json.load(f)
+        if cached["stamp"] == stamp:
+            return cached["config"]
+    except Exception:
+        pass  # Missing or unreadable cache - reparse below
+
+    import yaml
+
+    # libyaml-backed loader when PyYAML was built with it (the binary wheels are);
+    # fed bytes so the parser detects the encoding itself, no separate decode pass
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(config_path, "rb") as f:
+        user_config = yaml.load(f, Loader=loader) or {}
+
+    try:
+        payload = json.dumps({"stamp": stamp, "config": user_config})
+        # Only cache configs JSON represents exactly (no dates, non-str keys, ...)
+        if json.loads(payload)["config"] == user_config:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(payload, encoding="utf-8")
+            os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        pass  # Cache is an optimization; never fail on it
+
+    return user_config
+
+
+# Built once at import; sections are read-only views, so _load_config always
+# hands out a fresh mutable copy (callers such as the CLI override values)
+DEFAULT_CONFIG = MappingProxyType({
+    "default_tier": 1,
+    "auto_escalate": True,
+    "whisper": MappingProxyType({
+        "model": "large-v3-turbo",
+        "backend": "local",
+        "device": "auto",
+        "compute_type": "auto",
+        "beam_size": 5,
+        "language": None,
+        "initial_prompt": None,
+        "word_timestamps": False,
+        "cpu_threads": 0,
+        "num_workers": 1,
+    }),
+    "visual": MappingProxyType({
+        "scene_threshold": 3.0,
+        "ocr_engine": "paddleocr",
+        "min_scene_duration": 2.0,
+        "extract_every_n_seconds": None,
+        "deduplicate": True,
+        "dedup_threshold": 0.95,
+        "max_frames": 100,
+    }),
+    "output": MappingProxyType({
+        "directory": "./output",
+        "format": "markdown",
+        "include_timestamps": True,
+        "timestamp_interval": 30,
+        "include_metadata": True,
+    }),
+    "paths": MappingProxyType({
+        "temp_dir": "./temp",
+        "models_dir": None,
+    }),
+    "cleanup": MappingProxyType({
+        "delete_temp_files": True,
+        "keep_audio": False,
+        "keep_frames": False,
+    }),
+    "summarize": MappingProxyType({
+        "provider": "gemini",
+        "api_key": None,
+        "model": None,
+        "max_output_tokens": None,
+        "cache": True,
+    }),
+})
+_CONFIG_SECTIONS = frozenset(
+    key for key, value in DEFAULT_CONFIG.items() if isinstance(value, MappingProxyType)
+)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VideoMetadata:
     """Metadata about the analyzed video."""
     url: str
@@ -27,18 +126,25 @@ class VideoMetadata:
     duration: float | None = None
     has_visual_content: bool = False
     is_auto_generated: bool | None = None  # True=auto-captions, False=manual, None=unknown/Whisper
+    title: str | None = None  # Video title when the extractor already fetched it
 
 
-@dataclass
+@dataclass(frozen=True)
 class ComprehendResult:
-    """Combined result from video comprehension."""
+    """Combined result from video comprehension.
+
+    Frozen so the derived text below can be computed once and reused.
+    """
     metadata: VideoMetadata
     transcript_text: str
     transcript_segments: list
     visual_text: str = ""
     visual_frames: list = field(default_factory=list)
+    has_timestamps: bool = False  # Segments carry .start times (captions/Whisper, not Gemini)
+    # to_markdown output keyed by (include_timestamps, timestamp_interval)
+    _markdown_cache: dict = field(default_factory=dict, init=False, repr=False, compare=False)
 
-    @property
+    @cached_property
     def full_text(self) -> str:
         """Get complete extracted text (audio + visual)."""
         if self.visual_text:
@@ -47,6 +153,13 @@ class ComprehendResult:
 
     def to_markdown(self, include_timestamps: bool = True, timestamp_interval: int = 30) -> str:
         """Format result as markdown for LLM consumption."""
+        key = (include_timestamps, timestamp_interval)
+        if key not in self._markdown_cache:
+            self._markdown_cache[key] = self._render_markdown(include_timestamps, timestamp_interval)
+        return self._markdown_cache[key]
+
+    def _render_markdown(self, include_timestamps: bool, timestamp_interval: int) -> str:
+        """Build the markdown document for to_markdown."""
         # Determine source description
         if self.metadata.tier_used == "gemini":
             source_desc = "Gemini Direct Video Analysis"
@@ -62,34 +175,33 @@ class ComprehendResult:
         else:
             source_desc = "Whisper + Visual Analysis"
 
-        lines = [
-            "# Video Analysis",
-            "",
-            f"**Source:** {self.metadata.url}",
-            f"**Method:** {source_desc}",
-            f"**Language:** {self.metadata.language}",
-        ]
-
+        duration_line = ""
         if self.metadata.duration:
             minutes = int(self.metadata.duration // 60)
             seconds = int(self.metadata.duration % 60)
-            lines.append(f"**Duration:** {minutes}m {seconds}s")
+            duration_line = f"\n**Duration:** {minutes}m {seconds}s"
 
-        lines.extend(["", "---", "", "## Transcript", ""])
-
-        if include_timestamps and hasattr(self.transcript_segments[0] if self.transcript_segments else None, 'start'):
+        if include_timestamps and self.has_timestamps:
             # Group by intervals
-            lines.append(group_segments_by_interval(
+            body = group_segments_by_interval(
                 self.transcript_segments, timestamp_interval, bold=True
-            ))
+            )
         else:
-            lines.append(self.transcript_text)
+            body = self.transcript_text
 
+        visual_block = ""
         if self.visual_text:
-            lines.extend(["", "---", "", "## Visual Content (OCR)", ""])
-            lines.append(self.visual_text)
+            visual_block = f"\n\n---\n\n## Visual Content (OCR)\n\n{self.visual_text}"
 
-        return "\n".join(lines)
+        return (
+            "# Video Analysis\n\n"
+            f"**Source:** {self.metadata.url}\n"
+            f"**Method:** {source_desc}\n"
+            f"**Language:** {self.metadata.language}{duration_line}\n\n"
+            "---\n\n"
+            "## Transcript\n\n"
+            f"{body}{visual_block}"
+        )
 
 
 class VideoComprehend:
@@ -113,63 +225,23 @@ class VideoComprehend:
 
     def _load_config(self, config_path: Path | str | None) -> dict:
         """Load configuration from file or use defaults."""
-        defaults = {
-            "default_tier": 1,
-            "auto_escalate": True,
-            "whisper": {
-                "model": "large-v3-turbo",
-                "backend": "local",
-                "device": "auto",
-                "compute_type": "int8",
-                "beam_size": 5,
-                "language": None,
-                "initial_prompt": None,
-            },
-            "visual": {
-                "scene_threshold": 3.0,
-                "ocr_engine": "paddleocr",
-                "min_scene_duration": 2.0,
-                "extract_every_n_seconds": None,
-                "deduplicate": True,
-                "dedup_threshold": 0.95,
-                "max_frames": 100,
-            },
-            "output": {
-                "directory": "./output",
-                "format": "markdown",
-                "include_timestamps": True,
-                "timestamp_interval": 30,
-                "include_metadata": True,
-            },
-            "paths": {
-                "temp_dir": "./temp",
-                "models_dir": None,
-            },
-            "cleanup": {
-                "delete_temp_files": True,
-                "keep_audio": False,
-                "keep_frames": False,
-            },
-            "summarize": {
-                "provider": "gemini",
-                "api_key": None,
-                "model": None,
-            },
+        config = {
+            key: dict(value) if key in _CONFIG_SECTIONS else value
+            for key, value in DEFAULT_CONFIG.items()
         }
 
         if config_path:
             config_path = Path(config_path)
             if config_path.exists():
-                with open(config_path) as f:
-                    user_config = yaml.safe_load(f) or {}
-                # Deep merge
+                user_config = _read_user_config(config_path)
+                # Merge one level deep: user sections update the default sections
                 for key, value in user_config.items():
-                    if isinstance(value, dict) and key in defaults:
-                        defaults[key].update(value)
+                    if key in _CONFIG_SECTIONS and isinstance(value, dict):
+                        config[key].update(value)
                     else:
-                        defaults[key] = value
+                        config[key] = value
 
-        return defaults
+        return config
 
     @property
     def caption_extractor(self) -> CaptionExtractor:
@@ -193,11 +265,14 @@ class VideoComprehend:
             self._audio_extractor = AudioExtractor(
                 model_name=whisper_config.get("model", "large-v3-turbo"),
                 device=whisper_config.get("device", "auto"),
-                compute_type=whisper_config.get("compute_type", "int8"),
+                compute_type=whisper_config.get("compute_type", "auto"),
                 beam_size=whisper_config.get("beam_size", 5),
                 language=whisper_config.get("language"),
                 initial_prompt=whisper_config.get("initial_prompt"),
                 backend=whisper_config.get("backend", "local"),
+                word_timestamps=whisper_config.get("word_timestamps", False),
+                cpu_threads=whisper_config.get("cpu_threads", 0),
+                num_workers=whisper_config.get("num_workers", 1),
             )
         return self._audio_extractor
 
@@ -230,7 +305,7 @@ class VideoComprehend:
             except ImportError as e:
                 raise RuntimeError(
                     "Tier 3 visual analysis requires additional dependencies. "
-                    "Install with: pip install 'scenedetect[opencv]' paddlepaddle paddleocr imagededup"
+                    "Install with: pip install 'scenedetect[opencv]' paddlepaddle paddleocr"
                 ) from e
         return self._visual_extractor
 
@@ -304,9 +379,11 @@ class VideoComprehend:
                         tier_used=1,
                         language=result.language,
                         is_auto_generated=result.is_generated,
+                        title=result.title,
                     ),
                     transcript_text=result.text,
                     transcript_segments=result.segments,
+                    has_timestamps=True,
                 )
 
         # Try Tier 2: Audio transcription
@@ -328,9 +405,11 @@ class VideoComprehend:
                         tier_used=2,
                         language=result.language,
                         duration=result.duration,
+                        title=result.title,
                     ),
                     transcript_text=result.text,
                     transcript_segments=result.segments,
+                    has_timestamps=True,
                 )
 
             except AudioExtractionError as e:
@@ -368,9 +447,11 @@ class VideoComprehend:
                     language=audio_result.language,
                     duration=audio_result.duration,
                     has_visual_content=bool(visual_result.frames),
+                    title=audio_result.title,
                 ),
                 transcript_text=audio_result.text,
                 transcript_segments=audio_result.segments,
+                has_timestamps=True,
                 visual_text=visual_result.text,
                 visual_frames=visual_result.frames,
             )
@@ -3,11 +3,20 @@
 from .audio import AudioExtractor
 from .captions import CaptionExtractor
 
-__all__ = ["CaptionExtractor", "AudioExtractor"]
-
-# Tier 3 imports (optional, may not be installed)
-try:
-    from .visual import VisualExtractor
-    __all__.append("VisualExtractor")
-except ImportError:
-    VisualExtractor = None
+# VisualExtractor is None when the Tier 3 dependencies aren't installed
+__all__ = ["CaptionExtractor", "AudioExtractor", "VisualExtractor"]
+
+
+def __getattr__(name: str):
+    # Tier 3 imports (optional, may not be installed). scenedetect/paddleocr are
+    # heavy, so they load on first access instead of with every extractor import.
+    if name == "VisualExtractor":
+        try:
+            from . import visual
+
+            visual_extractor = visual.VisualExtractor
+        except ImportError:
+            visual_extractor = None
+        globals()[name] = visual_extractor
+        return visual_extractor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
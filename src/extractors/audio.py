@@ -16,42 +16,86 @@ import os
 import subprocess
 import sys
 import tempfile
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from ..utils import group_segments_by_interval
+from ..utils import CACHE_DIR, SilentLogger, group_segments_by_interval, read_info_title
 
 # Errors in yt-dlp stderr that a version update or retry may fix
 _RETRYABLE_DOWNLOAD_ERRORS = ("403", "PO Token", "po token", "Sign in to confirm")
 
+# Touched after each successful update check; checks within a day are skipped
+_YTDLP_CHECK_STAMP = CACHE_DIR / "ytdlp_checked"
+_YTDLP_CHECK_INTERVAL = 24 * 60 * 60
+_YTDLP_UPDATE_LOCK = threading.Lock()
+
+
+def _installed_ytdlp_version() -> str | None:
+    """Installed yt-dlp version, read from package metadata on disk."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("yt-dlp")
+    except PackageNotFoundError:
+        return None
+
 
 def ensure_ytdlp_updated(quiet: bool = True) -> bool:
     """
-    Update yt-dlp to latest version.
+    Update yt-dlp to latest version, at most once a day.
 
     Args:
         quiet: If True, suppress output
 
     Returns:
-        True if updated successfully
+        True if updated successfully or already checked within the last day
     """
-    try:
-        result = subprocess.run(
-            [sys.executable, "-m", "pip", "install", "-U", "yt-dlp"],
-            capture_output=True,
-            text=True,
-            timeout=60,
-        )
-        if not quiet and "Successfully installed" in result.stdout:
-            print(f"[yt-dlp] Updated: {result.stdout.strip()}", file=sys.stderr)
-        return result.returncode == 0
-    except Exception as e:
-        if not quiet:
-            print(f"[yt-dlp] Update failed: {e}", file=sys.stderr)
-        return False
+    # Serialized so concurrent downloads (extract_many) run pip at most once
+    with _YTDLP_UPDATE_LOCK:
+        try:
+            if time.time() - _YTDLP_CHECK_STAMP.stat().st_mtime < _YTDLP_CHECK_INTERVAL:
+                return True
+        except OSError:
+            pass  # Never checked (or cache unreadable)
+
+        try:
+            before = _installed_ytdlp_version()
+            result = subprocess.run(
+                [
+                    sys.executable, "-m", "pip", "install", "-U",
+                    "--quiet", "--disable-pip-version-check", "--no-input",
+                    "yt-dlp",
+                ],
+                capture_output=True,
+                text=True,
+                timeout=60,
+            )
+            if result.returncode != 0:
+                if not quiet:
+                    print(f"[yt-dlp] Update failed: {result.stderr.strip()}", file=sys.stderr)
+                return False
+
+            try:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                _YTDLP_CHECK_STAMP.touch()
+            except OSError:
+                pass  # Best effort; the next 403 just checks again
+
+            after = _installed_ytdlp_version()
+            if not quiet and after != before:
+                print(f"[yt-dlp] Updated: {before} -> {after}", file=sys.stderr)
+            return True
+        except Exception as e:
+            if not quiet:
+                print(f"[yt-dlp] Update failed: {e}", file=sys.stderr)
+            return False
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptSegment:
     """A single transcribed segment with timing and metadata."""
     text: str
@@ -64,18 +108,73 @@ class TranscriptSegment:
         return self.end - self.start
 
 
-@dataclass
+def _from_whisper(seg) -> TranscriptSegment:
+    """Convert a faster-whisper segment to a TranscriptSegment."""
+    segment = TranscriptSegment(text=seg.text, start=seg.start, end=seg.end)
+    if seg.words:  # Only populated when word_timestamps was requested
+        segment.words = [
+            {"word": w.word, "start": w.start, "end": w.end, "probability": w.probability}
+            for w in seg.words
+        ]
+    return segment
+
+
+class SegmentColumns(Sequence):
+    """Transcript segments stored as columns rather than one object each.
+
+    Timings live in float64 NumPy arrays (16 bytes per segment) and texts in a
+    plain list. Indexing or iterating yields `TranscriptSegment` views, so
+    callers that read `seg.start` / `seg.text` keep working unchanged.
+    """
+
+    def __init__(
+        self,
+        texts: list[str],
+        starts,
+        ends,
+        words: list[list[dict]] | None = None,
+    ):
+        import numpy as np
+
+        self.texts = texts
+        self.starts = np.asarray(starts, dtype=np.float64)
+        self.ends = np.asarray(ends, dtype=np.float64)
+        self.words = words  # Per-segment word timings, or None if not collected
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return TranscriptSegment(
+            text=self.texts[index],
+            start=float(self.starts[index]),
+            end=float(self.ends[index]),
+            words=self.words[index] if self.words else [],
+        )
+
+    def __iter__(self):
+        words = self.words or [[]] * len(self.texts)
+        for text, start, end, seg_words in zip(
+            self.texts, self.starts.tolist(), self.ends.tolist(), words
+        ):
+            yield TranscriptSegment(text=text, start=start, end=end, words=seg_words)
+
+
+@dataclass(slots=True)
 class TranscriptResult:
     """Result from audio transcription."""
-    segments: list[TranscriptSegment]
+    segments: SegmentColumns
     language: str
     language_probability: float
     duration: float  # Total audio duration in seconds
+    title: str | None = None  # Video title from yt-dlp's info JSON, if downloaded
 
     @property
     def text(self) -> str:
         """Get full transcript as plain text."""
-        return " ".join(seg.text.strip() for seg in self.segments)
+        return " ".join(text.strip() for text in self.segments.texts)
 
     def text_with_timestamps(self, interval: int = 30) -> str:
         """Get transcript grouped by time intervals."""
@@ -94,13 +193,16 @@ class AudioExtractor:
         self,
         model_name: str = "large-v3-turbo",
         device: str = "auto",
-        compute_type: str = "int8",
+        compute_type: str = "auto",
         beam_size: int = 5,
         language: str | None = None,
         initial_prompt: str | None = None,
         temp_dir: str | Path | None = None,
         backend: str = "local",
         groq_api_key: str | None = None,
+        word_timestamps: bool = False,
+        cpu_threads: int = 0,
+        num_workers: int = 1,
     ):
         """
         Initialize the audio extractor.
@@ -109,13 +211,18 @@ class AudioExtractor:
             model_name: Whisper model (tiny, small, medium, large-v3,
                         large-v3-turbo, distil-large-v3.5)
             device: Device to use (auto, cpu, cuda) - handled by CTranslate2
-            compute_type: Quantization type (int8, float16, float32)
+            compute_type: Quantization type (auto, int8, int8_float16, float16,
+                          float32); auto = int8_float16 on CUDA, int8 on CPU
             beam_size: Beam size for decoding
             language: Force specific language or None for auto-detect
             initial_prompt: Optional text to guide Whisper's style/vocabulary
             temp_dir: Directory for temporary files
             backend: "local" (faster-whisper) or "groq" (free cloud Whisper API)
             groq_api_key: Groq API key (falls back to GROQ_API_KEY env var)
+            word_timestamps: Align per-word timings (extra decode pass; off
+                             unless a caller needs `segment.words`)
+            cpu_threads: CTranslate2 threads per worker (0 = library default)
+            num_workers: Parallel model workers for concurrent transcriptions
         """
         self.model_name = model_name
         self.device = device
@@ -126,31 +233,70 @@ class AudioExtractor:
         self.temp_dir = Path(temp_dir) if temp_dir else None
         self.backend = backend
         self.groq_api_key = groq_api_key or os.environ.get("GROQ_API_KEY")
+        self.word_timestamps = word_timestamps
+        self.cpu_threads = cpu_threads
+        self.num_workers = num_workers
 
         self._model = None
         self._pipeline = None
+        # Guards lazy model loading, which may start on a preload thread
+        self._model_lock = threading.RLock()
 
     @property
     def model(self):
-        """Lazy-load the Whisper model (CTranslate2 resolves device='auto')."""
-        if self._model is None:
-            from faster_whisper import WhisperModel
-
-            self._model = WhisperModel(
-                self.model_name,
-                device=self.device,
-                compute_type=self.compute_type,
-            )
-        return self._model
+        """Lazy-load the Whisper model, picking the quantization for the device."""
+        with self._model_lock:
+            if self._model is None:
+                from faster_whisper import WhisperModel
+
+                device = self.device
+                if device == "auto":
+                    import ctranslate2
+
+                    device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+
+                # INT8 weights with FP16 accumulation use tensor-core GEMMs on
+                # CUDA; plain int8 is the fast path on CPU (AVX2/VNNI)
+                compute_type = self.compute_type
+                if compute_type == "auto":
+                    compute_type = "int8_float16" if device == "cuda" else "int8"
+
+                self._model = WhisperModel(
+                    self.model_name,
+                    device=device,
+                    compute_type=compute_type,
+                    cpu_threads=self.cpu_threads,
+                    num_workers=self.num_workers,
+                )
+            return self._model
 
     @property
     def pipeline(self):
         """Lazy-load the batched inference pipeline (~4x faster than sequential)."""
-        if self._pipeline is None:
-            from faster_whisper import BatchedInferencePipeline
+        with self._model_lock:
+            if self._pipeline is None:
+                from faster_whisper import BatchedInferencePipeline
+
+                self._pipeline = BatchedInferencePipeline(model=self.model)
+            return self._pipeline
+
+    def preload_model(self):
+        """Start loading the Whisper model on a background thread.
+
+        Weight loading is disk/GPU-bound and the download is network-bound,
+        so they overlap; the first real use of the model waits on the lock
+        until loading finishes. A no-op for Groq or once the model is loaded.
+        """
+        if self.backend != "local" or self._pipeline is not None:
+            return
+
+        def load():
+            try:
+                self.pipeline
+            except Exception:
+                pass  # Raised again on first use, in the caller's thread
 
-            self._pipeline = BatchedInferencePipeline(model=self.model)
-        return self._pipeline
+        threading.Thread(target=load, daemon=True).start()
 
     def download_audio(self, url: str, output_path: Path | None = None) -> Path:
         """
@@ -179,6 +325,7 @@ class AudioExtractor:
             "--audio-format", "opus",
             "--audio-quality", "0",
             "-o", output_template,
+            "--write-info-json",  # Title for the output filename, no extra request
             "--print", "after_move:filepath",  # Print final path
             url,
         ]
@@ -196,13 +343,122 @@ class AudioExtractor:
             return audio_path
 
         try:
-            return run_download()
+            from yt_dlp import YoutubeDL
+            from yt_dlp.utils import DownloadError
+        except ImportError:
+            return self._run_ytdlp(run_download)
+
+        # Same download as `cmd`, run in-process: no interpreter start-up or
+        # yt-dlp import per call, and the final path comes back in the info dict
+        options = {
+            "format": "bestaudio/best",
+            "outtmpl": output_template,
+            "noplaylist": True,
+            "writeinfojson": True,
+            "postprocessors": [{
+                "key": "FFmpegExtractAudio",
+                "preferredcodec": "opus",
+                "preferredquality": "0",
+            }],
+            "quiet": True,
+            "no_warnings": True,
+            "noprogress": True,
+            "logger": SilentLogger(),
+        }
+
+        def run_in_process():
+            try:
+                with YoutubeDL(options) as ydl:
+                    info = ydl.extract_info(url)
+            except DownloadError as e:
+                # Same shape as a failed CLI run, so the retry check applies
+                raise subprocess.CalledProcessError(1, cmd, stderr=str(e)) from e
+            audio_path = Path(info["requested_downloads"][-1]["filepath"])
+            if not audio_path.exists():
+                raise AudioExtractionError(f"Audio file not found at: {audio_path}")
+            return audio_path
+
+        # The retry goes through the CLI so it runs the yt-dlp that was just
+        # updated, not the copy already imported into this process
+        return self._run_ytdlp(run_in_process, retry=run_download)
+
+    def stream_audio(self, url: str, info_dir: Path):
+        """
+        Stream audio from yt-dlp through ffmpeg straight into memory.
+
+        yt-dlp writes the audio container to a pipe, and ffmpeg decodes it
+        to the 16 kHz mono PCM Whisper expects, so nothing is written to or
+        re-read from disk and faster-whisper skips its own decode.
+
+        Args:
+            url: Video URL
+            info_dir: Directory for yt-dlp's `audio.info.json` (video title)
+
+        Returns:
+            float32 NumPy array of 16 kHz mono samples
+        """
+        cmd = [
+            "yt-dlp",
+            "--no-playlist",
+            "--no-progress",
+            "-f", "bestaudio/best",
+            "-o", "-",
+            "-o", f"infojson:{info_dir / 'audio'}",
+            "--write-info-json",
+            url,
+        ]
+        decode_cmd = [
+            "ffmpeg", "-loglevel", "error",
+            "-i", "pipe:0",
+            "-f", "s16le", "-ac", "1", "-ar", "16000",
+            "pipe:1",
+        ]
+
+        def run_stream():
+            # stderr goes to a file: an unread pipe could fill and stall yt-dlp
+            with tempfile.TemporaryFile() as err:
+                ytdlp = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=err)
+                try:
+                    ffmpeg = subprocess.Popen(
+                        decode_cmd,
+                        stdin=ytdlp.stdout,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL,
+                    )
+                finally:
+                    ytdlp.stdout.close()  # ffmpeg holds the only read end now
+                pcm, _ = ffmpeg.communicate()
+                ytdlp.wait()
+
+                if ytdlp.returncode != 0:
+                    err.seek(0)
+                    raise subprocess.CalledProcessError(
+                        ytdlp.returncode, cmd,
+                        stderr=err.read().decode("utf-8", errors="replace"),
+                    )
+            if ffmpeg.returncode != 0 or not pcm:
+                raise AudioExtractionError("ffmpeg could not decode the audio stream")
+
+            import numpy as np
+
+            return np.frombuffer(pcm, np.int16).astype(np.float32) / 32768.0
+
+        return self._run_ytdlp(run_stream)
+
+    @staticmethod
+    def _run_ytdlp(run: callable, retry: callable = None):
+        """Run a yt-dlp step, updating yt-dlp and retrying once on 403 / PO-token errors.
+
+        `retry` runs instead of `run` for the second attempt when given.
+        """
+        try:
+            return run()
         except subprocess.CalledProcessError as e:
             # On 403 / PO-token errors, try updating yt-dlp and retry once
             if any(marker in e.stderr for marker in _RETRYABLE_DOWNLOAD_ERRORS):
                 ensure_ytdlp_updated(quiet=False)
                 try:
-                    return run_download()
+                    return (retry or run)()
                 except subprocess.CalledProcessError as e2:
                     raise AudioExtractionError(
                         f"yt-dlp failed: {e2.stderr}\n"
@@ -215,12 +471,14 @@ class AudioExtractor:
         except Exception as e:
             raise AudioExtractionError(f"Failed to download audio: {e}")
 
-    def transcribe(self, audio_path: Path | str) -> TranscriptResult:
+    def transcribe(self, audio_path: Path | str, sink: callable = None) -> TranscriptResult:
         """
         Transcribe an audio file with the configured backend.
 
         Args:
             audio_path: Path to audio file
+            sink: Optional callable invoked with each TranscriptSegment as it
+                  is decoded, before the full transcript is finished
 
         Returns:
             TranscriptResult with segments and metadata
@@ -231,46 +489,51 @@ class AudioExtractor:
             raise AudioExtractionError(f"Audio file not found: {audio_path}")
 
         if self.backend == "groq":
-            return self._transcribe_groq(audio_path)
-        return self._transcribe_local(audio_path)
+            result = self._transcribe_groq(audio_path)
+            if sink:
+                for segment in result.segments:
+                    sink(segment)
+            return result
+        return self._transcribe_local(audio_path, sink)
 
-    def _transcribe_local(self, audio_path: Path) -> TranscriptResult:
-        """Transcribe with faster-whisper (batched, falling back to sequential)."""
+    def _decode_local(self, audio):
+        """Start faster-whisper decoding; returns a lazy segment iterator and info.
+
+        `audio` is a file path or a float32 array of 16 kHz mono samples.
+        """
+        if isinstance(audio, Path):
+            audio = str(audio)
         kwargs = dict(
             beam_size=self.beam_size,
             language=self.language,
             initial_prompt=self.initial_prompt,
-            word_timestamps=True,
+            word_timestamps=self.word_timestamps,
         )
 
         try:
-            segments_iter, info = self.pipeline.transcribe(
-                str(audio_path), batch_size=8, **kwargs
-            )
+            return self.pipeline.transcribe(audio, batch_size=8, **kwargs)
         except Exception:
             # Batched pipeline can fail on unusual audio/args; sequential is safe
-            segments_iter, info = self.model.transcribe(
-                str(audio_path), vad_filter=True, **kwargs
-            )
+            return self.model.transcribe(audio, vad_filter=True, **kwargs)
 
-        segments = []
+    def _transcribe_local(self, audio, sink: callable = None) -> TranscriptResult:
+        """Transcribe with faster-whisper (batched, falling back to sequential)."""
+        segments_iter, info = self._decode_local(audio)
+
+        texts, starts, ends = [], [], []
+        words = [] if self.word_timestamps else None
         for seg in segments_iter:
-            words = []
-            if seg.words:
-                words = [
-                    {"word": w.word, "start": w.start, "end": w.end, "probability": w.probability}
-                    for w in seg.words
-                ]
-
-            segments.append(TranscriptSegment(
-                text=seg.text,
-                start=seg.start,
-                end=seg.end,
-                words=words,
-            ))
+            segment = _from_whisper(seg)
+            texts.append(segment.text)
+            starts.append(segment.start)
+            ends.append(segment.end)
+            if words is not None:
+                words.append(segment.words)
+            if sink:
+                sink(segment)
 
         return TranscriptResult(
-            segments=segments,
+            segments=SegmentColumns(texts, starts, ends, words),
             language=info.language,
             language_probability=info.language_probability,
             duration=info.duration,
@@ -307,17 +570,17 @@ class AudioExtractor:
         except Exception as e:
             raise AudioExtractionError(f"Groq transcription failed: {e}") from e
 
+        def field_of(s, name, default):
+            return getattr(s, name, s.get(name, default) if isinstance(s, dict) else default)
+
         raw_segments = getattr(resp, "segments", None) or []
-        segments = [
-            TranscriptSegment(
-                text=getattr(s, "text", s.get("text", "") if isinstance(s, dict) else ""),
-                start=getattr(s, "start", s.get("start", 0) if isinstance(s, dict) else 0),
-                end=getattr(s, "end", s.get("end", 0) if isinstance(s, dict) else 0),
-            )
-            for s in raw_segments
-        ]
+        segments = SegmentColumns(
+            texts=[field_of(s, "text", "") for s in raw_segments],
+            starts=[field_of(s, "start", 0) for s in raw_segments],
+            ends=[field_of(s, "end", 0) for s in raw_segments],
+        )
 
-        duration = getattr(resp, "duration", None) or (segments[-1].end if segments else 0.0)
+        duration = getattr(resp, "duration", None) or (float(segments.ends[-1]) if segments else 0.0)
 
         return TranscriptResult(
             segments=segments,
@@ -331,6 +594,7 @@ class AudioExtractor:
         url: str,
         keep_audio: bool = False,
         progress_callback: callable = None,
+        sink: callable = None,
     ) -> TranscriptResult:
         """
         Download audio and transcribe in one step.
@@ -339,10 +603,27 @@ class AudioExtractor:
             url: Video URL
             keep_audio: Whether to keep the audio file after transcription
             progress_callback: Optional callback for progress updates
+            sink: Optional callable invoked with each segment as it is decoded
 
         Returns:
             TranscriptResult with segments and metadata
         """
+        self.preload_model()
+
+        if self._can_stream_audio(keep_audio):
+            with self._info_dir() as info_dir:
+                if progress_callback:
+                    progress_callback("Downloading audio...")
+
+                audio = self.stream_audio(url, Path(info_dir))
+
+                if progress_callback:
+                    progress_callback("Transcribing with Whisper...")
+
+                result = self._transcribe_local(audio, sink)
+                result.title = read_info_title(Path(info_dir) / "audio.info.json")
+                return result
+
         audio_path = None
 
         try:
@@ -355,12 +636,157 @@ class AudioExtractor:
                 label = "Groq Whisper API" if self.backend == "groq" else "Whisper"
                 progress_callback(f"Transcribing with {label}...")
 
-            return self.transcribe(audio_path)
+            result = self.transcribe(audio_path, sink=sink)
+            result.title = read_info_title(audio_path.with_suffix(".info.json"))
+            return result
 
         finally:
-            # Cleanup unless keep_audio is True
-            if audio_path and audio_path.exists() and not keep_audio:
+            self._cleanup(audio_path, keep_audio)
+
+    def extract_many(
+        self,
+        urls: list[str],
+        keep_audio: bool = False,
+        download_workers: int = 2,
+        progress_callback: callable = None,
+    ) -> list[TranscriptResult]:
+        """
+        Transcribe several videos, downloading ahead while Whisper runs.
+
+        Downloads are network-bound and transcription is CPU/GPU-bound, so up
+        to `download_workers` downloads run in the background while videos
+        are transcribed one at a time, in input order. A URL listed more than
+        once is downloaded and transcribed once (concurrent downloads of the
+        same video would share one audio file) and its result repeated.
+
+        Args:
+            urls: Video URLs
+            keep_audio: Whether to keep the audio files after transcription
+            download_workers: Concurrent yt-dlp downloads
+            progress_callback: Optional callback for progress updates
+
+        Returns:
+            TranscriptResult per URL, in the same order
+        """
+        self.preload_model()
+
+        unique_urls = list(dict.fromkeys(urls))
+        results = []
+        pool = ThreadPoolExecutor(max_workers=download_workers)
+        downloads = [pool.submit(self.download_audio, url) for url in unique_urls]
+
+        try:
+            for index, download in enumerate(downloads, 1):
+                if progress_callback:
+                    progress_callback(f"Downloading audio ({index}/{len(unique_urls)})...")
+
+                audio_path = download.result()
                 try:
-                    audio_path.unlink()
-                except Exception:
-                    pass  # Best effort cleanup
+                    if progress_callback:
+                        progress_callback(f"Transcribing audio ({index}/{len(unique_urls)})...")
+
+                    result = self.transcribe(audio_path)
+                    result.title = read_info_title(audio_path.with_suffix(".info.json"))
+                    results.append(result)
+                finally:
+                    self._cleanup(audio_path, keep_audio)
+        finally:
+            for download in downloads:
+                download.cancel()  # No-op for downloads already running or done
+            pool.shutdown(wait=True)
+
+            # Audio fetched ahead for videos that were never transcribed
+            for download in downloads[len(results) + 1:]:
+                if not download.cancelled() and download.exception() is None:
+                    self._cleanup(download.result(), keep_audio)
+
+        by_url = dict(zip(unique_urls, results))
+        return [by_url[url] for url in urls]
+
+    def extract_stream(
+        self,
+        url: str,
+        keep_audio: bool = False,
+        progress_callback: callable = None,
+    ) -> Iterator[TranscriptSegment]:
+        """
+        Download audio and yield segments as Whisper decodes them.
+
+        Nothing is accumulated, so output can start after the first decode
+        window instead of after the whole file. The Groq backend returns the
+        transcript in one response and is yielded from that.
+
+        Args:
+            url: Video URL
+            keep_audio: Whether to keep the audio file after transcription
+            progress_callback: Optional callback for progress updates
+
+        Yields:
+            TranscriptSegment for each decoded segment, in order
+        """
+        self.preload_model()
+
+        if self._can_stream_audio(keep_audio):
+            with self._info_dir() as info_dir:
+                if progress_callback:
+                    progress_callback("Downloading audio...")
+
+                audio = self.stream_audio(url, Path(info_dir))
+
+                if progress_callback:
+                    progress_callback("Transcribing with Whisper...")
+
+                segments_iter, _ = self._decode_local(audio)
+                for seg in segments_iter:
+                    yield _from_whisper(seg)
+            return
+
+        audio_path = None
+
+        try:
+            if progress_callback:
+                progress_callback("Downloading audio...")
+
+            audio_path = self.download_audio(url)
+
+            if progress_callback:
+                label = "Groq Whisper API" if self.backend == "groq" else "Whisper"
+                progress_callback(f"Transcribing with {label}...")
+
+            if self.backend == "groq":
+                yield from self._transcribe_groq(audio_path).segments
+                return
+
+            segments_iter, _ = self._decode_local(audio_path)
+            for seg in segments_iter:
+                yield _from_whisper(seg)
+
+        finally:
+            self._cleanup(audio_path, keep_audio)
+
+    def _can_stream_audio(self, keep_audio: bool) -> bool:
+        """Whether audio can go straight to Whisper without a file on disk.
+
+        Groq uploads a file and keep_audio wants one left behind, so both
+        use the download path.
+        """
+        return self.backend == "local" and not keep_audio
+
+    def _info_dir(self) -> tempfile.TemporaryDirectory:
+        """Temporary directory for yt-dlp's info JSON in streaming mode."""
+        if self.temp_dir:
+            self.temp_dir.mkdir(parents=True, exist_ok=True)
+        return tempfile.TemporaryDirectory(dir=self.temp_dir)
+
+    @staticmethod
+    def _cleanup(audio_path: Path | None, keep_audio: bool):
+        """Remove the info JSON and, unless keep_audio is set, the audio file."""
+        if audio_path:
+            audio_path.with_suffix(".info.json").unlink(missing_ok=True)
+
+        # Cleanup unless keep_audio is True
+        if audio_path and audio_path.exists() and not keep_audio:
+            try:
+                audio_path.unlink()
+            except Exception:
+                pass  # Best effort cleanup
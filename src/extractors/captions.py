@@ -10,9 +10,12 @@ Two routes:
 """
 
 import re
+import string
 import subprocess
 import tempfile
+from collections.abc import Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 from youtube_transcript_api import (
@@ -26,7 +29,16 @@ from youtube_transcript_api import (
     YouTubeTranscriptApi,
 )
 
-from ..utils import group_segments_by_interval
+from ..utils import group_segments_by_interval, read_info_title
+
+# One pass over the input: a known URL form (group 1) or just the ID itself (group 2)
+_VIDEO_ID_RE = re.compile(
+    r"(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/|youtube\.com/shorts/)([a-zA-Z0-9_-]{11})"
+    r"|^([a-zA-Z0-9_-]{11})$"
+)
+
+# Characters of a bare video ID, for the set check that skips the regex
+_VIDEO_ID_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
 
 
 @dataclass
@@ -41,18 +53,53 @@ class CaptionSegment:
         return self.start + self.duration
 
 
+class CaptionColumns(Sequence):
+    """Caption segments stored as columns rather than one object each.
+
+    Starts and durations live in float64 NumPy arrays and texts in a plain
+    list. Indexing or iterating yields `CaptionSegment` views, so callers
+    that read `seg.start` / `seg.text` keep working unchanged.
+    """
+
+    def __init__(self, texts: list[str], starts, durations):
+        import numpy as np
+
+        self.texts = texts
+        self.starts = np.asarray(starts, dtype=np.float64)
+        self.durations = np.asarray(durations, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return CaptionSegment(
+            text=self.texts[index],
+            start=float(self.starts[index]),
+            duration=float(self.durations[index]),
+        )
+
+    def __iter__(self):
+        for text, start, duration in zip(
+            self.texts, self.starts.tolist(), self.durations.tolist()
+        ):
+            yield CaptionSegment(text=text, start=start, duration=duration)
+
+
 @dataclass
 class CaptionResult:
     """Result from caption extraction."""
     video_id: str
-    segments: list[CaptionSegment]
+    segments: CaptionColumns
     language: str
     is_generated: bool  # True if auto-generated captions
+    title: str | None = None  # Video title, when the route exposes it
 
     @property
     def text(self) -> str:
         """Get full transcript as plain text."""
-        return " ".join(seg.text for seg in self.segments)
+        return " ".join(self.segments.texts)
 
     def text_with_timestamps(self, interval: int = 30) -> str:
         """Get transcript grouped by time intervals."""
@@ -86,19 +133,18 @@ class CaptionExtractor:
         """
         self.preferred_languages = preferred_languages or ["en"]
         self._api = YouTubeTranscriptApi()
+        # Per-instance so is_available() followed by extract() lists once
+        self._list_transcripts = lru_cache(maxsize=256)(self._api.list)
 
     @staticmethod
     def extract_video_id(url: str) -> str:
         """Extract video ID from various YouTube URL formats."""
-        patterns = [
-            r'(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/|youtube\.com/shorts/)([a-zA-Z0-9_-]{11})',
-            r'^([a-zA-Z0-9_-]{11})$',  # Just the ID itself
-        ]
+        if len(url) == 11 and _VIDEO_ID_CHARS.issuperset(url):
+            return url  # Already a bare ID
 
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
+        match = _VIDEO_ID_RE.search(url)
+        if match:
+            return match.group(1) or match.group(2)
 
         raise ValueError(f"Could not extract video ID from: {url}")
 
@@ -120,7 +166,7 @@ class CaptionExtractor:
 
         try:
             # List available transcripts (API v1.x uses .list())
-            transcript_list = self._api.list(video_id)
+            transcript_list = self._list_transcripts(video_id)
 
             # Try preferred languages first (manual or auto-generated)
             transcript = None
@@ -140,11 +186,17 @@ class CaptionExtractor:
                     transcript = next(iter(transcript_list))
                     is_generated = transcript.is_generated
 
-                    if transcript.language_code not in self.preferred_languages:
+                    # find_transcript() above already matched auto-generated
+                    # tracks, so only a foreign-language track reaches here
+                    if (
+                        transcript.language_code not in self.preferred_languages
+                        and transcript.is_translatable
+                    ):
                         try:
                             transcript = transcript.translate(self.preferred_languages[0])
                         except Exception:
-                            pass  # Keep original if translation fails
+                            # Keep original if translation fails; list afresh next time
+                            self._list_transcripts.cache_clear()
 
                 except StopIteration:
                     raise CaptionExtractionError(
@@ -153,14 +205,11 @@ class CaptionExtractor:
 
             data = transcript.fetch()
 
-            segments = [
-                CaptionSegment(
-                    text=item.text,
-                    start=item.start,
-                    duration=item.duration
-                )
-                for item in data
-            ]
+            segments = CaptionColumns(
+                texts=[item.text for item in data],
+                starts=[item.start for item in data],
+                durations=[item.duration for item in data],
+            )
 
             return CaptionResult(
                 video_id=video_id,
@@ -199,7 +248,7 @@ class CaptionExtractor:
         """Check if captions are available for a video."""
         try:
             video_id = self.extract_video_id(url_or_id)
-            self._api.list(video_id)
+            self._list_transcripts(video_id)
             return True
         except Exception:
             return False
@@ -217,13 +266,15 @@ def _vtt_ts_to_seconds(h: str, m: str, s: str, ms: str) -> float:
     return int(h) * 3600 + int(m) * 60 + int(s) + int(ms) / 1000
 
 
-def parse_vtt(content: str) -> list[CaptionSegment]:
+def parse_vtt(content: str) -> CaptionColumns:
     """Parse WebVTT into caption segments.
 
     Handles YouTube auto-caption quirks: inline word-timing tags are
     stripped and rolling duplicate lines are collapsed.
     """
-    segments: list[CaptionSegment] = []
+    texts: list[str] = []
+    starts: list[float] = []
+    durations: list[float] = []
     last_line = None
 
     for block in re.split(r"\n\s*\n", content):
@@ -246,10 +297,12 @@ def parse_vtt(content: str) -> list[CaptionSegment]:
             text = re.sub(r"\s+", " ", text).strip()
             if not text or text == last_line:
                 continue
-            segments.append(CaptionSegment(text=text, start=start, duration=end - start))
+            texts.append(text)
+            starts.append(start)
+            durations.append(end - start)
             last_line = text
 
-    return segments
+    return CaptionColumns(texts, starts, durations)
 
 
 class YtDlpCaptionExtractor:
@@ -283,6 +336,7 @@ class YtDlpCaptionExtractor:
                             segments=segments,
                             language=language,
                             is_generated=is_generated,
+                            title=read_info_title(Path(tmp) / f"{video_id}.info.json"),
                         )
 
         raise CaptionExtractionError(
@@ -295,6 +349,7 @@ class YtDlpCaptionExtractor:
             "yt-dlp",
             "--no-playlist",
             "--skip-download",
+            "--write-info-json",  # Title for the output filename, no extra request
             flag,
             "--sub-format", "vtt",
             "--sub-langs", sub_langs,
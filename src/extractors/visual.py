@@ -4,16 +4,25 @@ Full video comprehension with scene detection, frame extraction, and OCR.
 Extracts visual content like slides, code, diagrams alongside audio.
 
 Requires additional dependencies:
-    pip install "scenedetect[opencv]" paddlepaddle paddleocr imagededup pillow
+    pip install "scenedetect[opencv]" paddlepaddle paddleocr pillow
 """
 
+import os
+import statistics
 import subprocess
 import tempfile
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from itertools import combinations
 from pathlib import Path
 
 from ..utils import format_time
 
+# Above this many frames, dedup compares only hash-band candidates instead
+# of building the full pairwise distance matrix
+_DENSE_DEDUP_MAX_FRAMES = 256
+
 # Optional imports - may not be installed
 try:
     from scenedetect import ContentDetector, detect
@@ -28,17 +37,25 @@ except ImportError:
     PADDLEOCR_AVAILABLE = False
 
 try:
-    from imagededup.methods import PHash
-    IMAGEDEDUP_AVAILABLE = True
+    # CPU alternative: PP-OCR models (int8-quantized) on ONNX Runtime
+    from rapidocr_onnxruntime import RapidOCR
+    RAPIDOCR_AVAILABLE = True
+except ImportError:
+    RAPIDOCR_AVAILABLE = False
+
+try:
+    import cv2  # Installed with scenedetect[opencv]; used for frame hashing
+    import numpy as np
+    OPENCV_AVAILABLE = True
 except ImportError:
-    IMAGEDEDUP_AVAILABLE = False
+    OPENCV_AVAILABLE = False
 
 
 @dataclass
 class FrameContent:
     """Content extracted from a single video frame."""
     timestamp: float
-    frame_path: Path
+    frame_path: Path | None  # None when the frame was only held in memory
     ocr_text: str = ""
     confidence: float = 0.0
     scene_index: int = 0
@@ -62,6 +79,56 @@ class VisualResult:
         )
 
 
+def _phash64(frame):
+    """64-bit perceptual hash of a frame, or None if it can't be read.
+
+    `frame` is an image path or a BGR array. DCT of a 32x32 grayscale
+    thumbnail; the 8x8 lowest frequencies are thresholded at their median.
+    """
+    if isinstance(frame, np.ndarray):
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    else:
+        gray = cv2.imread(os.fspath(frame), cv2.IMREAD_GRAYSCALE)
+        if gray is None:
+            return None
+    thumb = cv2.resize(gray, (32, 32), interpolation=cv2.INTER_AREA)
+    low = cv2.dct(np.float32(thumb))[:8, :8]
+    return np.packbits(low > np.median(low)).view(">u8")[0]
+
+
+def _popcount64(values):
+    """Set bits per element of a uint64 array."""
+    if hasattr(np, "bitwise_count"):  # NumPy >= 2.0
+        return np.bitwise_count(values)
+    bits = np.unpackbits(values.view(np.uint8), axis=-1)
+    return bits.reshape(*values.shape, 64).sum(axis=-1)
+
+
+def _close_to_earlier_banded(codes, max_distance: int) -> list[int]:
+    """Indices of codes within max_distance bits of an earlier code.
+
+    The 64 bits are split into max_distance + 1 bands; codes that close
+    must agree exactly on at least one band (pigeonhole), so only codes
+    sharing a band value are compared. Same result as the all-pairs
+    matrix without its O(N^2) memory.
+    """
+    edges = np.linspace(0, 64, max_distance + 2).astype(int).tolist()
+    candidates = set()
+    for lo, hi in zip(edges, edges[1:]):
+        band = (codes >> np.uint64(lo)) & np.uint64((1 << (hi - lo)) - 1)
+        buckets = defaultdict(list)
+        for i, key in enumerate(band.tolist()):
+            buckets[key].append(i)
+        for members in buckets.values():
+            candidates.update(combinations(members, 2))
+
+    if not candidates:
+        return []
+    pairs = np.array(sorted(candidates))
+    distances = _popcount64(codes[pairs[:, 0]] ^ codes[pairs[:, 1]])
+    return sorted(set(pairs[distances <= max_distance, 1].tolist()))
+
+
 class VisualExtractor:
     """Extract visual content from videos using scene detection and OCR."""
 
@@ -81,17 +148,17 @@ class VisualExtractor:
         Args:
             scene_threshold: Sensitivity for scene detection (lower = more scenes)
             min_scene_duration: Minimum seconds between scene changes
-            ocr_engine: OCR engine to use (paddleocr, tesseract)
+            ocr_engine: OCR engine to use (paddleocr, rapidocr)
             deduplicate: Whether to remove near-duplicate frames
             dedup_threshold: Similarity threshold for deduplication (0-1)
             max_frames: Maximum frames to process
             temp_dir: Directory for temporary files
         """
+        self.ocr_engine = ocr_engine
         self._check_dependencies()
 
         self.scene_threshold = scene_threshold
         self.min_scene_duration = min_scene_duration
-        self.ocr_engine = ocr_engine
         self.deduplicate = deduplicate
         self.dedup_threshold = dedup_threshold
         self.max_frames = max_frames
@@ -105,10 +172,11 @@ class VisualExtractor:
 
         if not SCENEDETECT_AVAILABLE:
             missing.append("scenedetect[opencv]")
-        if not PADDLEOCR_AVAILABLE:
+        if self.ocr_engine == "rapidocr":
+            if not RAPIDOCR_AVAILABLE:
+                missing.append("rapidocr_onnxruntime")
+        elif not PADDLEOCR_AVAILABLE:
             missing.append("paddleocr paddlepaddle")
-        if not IMAGEDEDUP_AVAILABLE:
-            missing.append("imagededup")
 
         if missing:
             raise VisualExtractionError(
@@ -125,7 +193,10 @@ class VisualExtractor:
                     use_angle_cls=True,
                     lang='en',
                     show_log=False,
+                    rec_batch_num=16,  # Text lines recognized per batch (default 6); slides are dense
                 )
+            elif self.ocr_engine == "rapidocr":
+                self._ocr_model = RapidOCR()
             else:
                 raise VisualExtractionError(f"Unsupported OCR engine: {self.ocr_engine}")
         return self._ocr_model
@@ -167,6 +238,17 @@ class VisualExtractor:
         except subprocess.CalledProcessError as e:
             raise VisualExtractionError(f"yt-dlp failed: {e.stderr}")
 
+    @staticmethod
+    def _probe_duration(video_path: Path) -> float:
+        """Video duration in seconds via ffprobe (0.0 if unknown)."""
+        cmd = ["ffprobe", "-v", "error", "-show_entries", "format=duration",
+               "-of", "default=noprint_wrappers=1:nokey=1", str(video_path)]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        try:
+            return float(result.stdout.strip())
+        except ValueError:
+            return 0.0  # Empty or "N/A"
+
     def detect_scenes(self, video_path: Path) -> list[tuple[float, float]]:
         """
         Detect scene changes in video.
@@ -201,97 +283,166 @@ class VisualExtractor:
         Returns:
             List of paths to extracted frame images
         """
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as pool:
+            jobs = self._submit_frames(pool, video_path, timestamps, output_dir)
+
+        return [path for _ts, grab in jobs if (path := grab.result()) is not None]
+
+    def _submit_frames(
+        self,
+        pool: ThreadPoolExecutor,
+        video_path: Path,
+        timestamps: list[float],
+        output_dir: Path | None = None,
+        in_memory: bool = False,
+    ) -> list[tuple[float, Future]]:
+        """Queue one frame grab per timestamp (up to max_frames) on `pool`.
+
+        Each grab is an independent input-seeking ffmpeg run, so they run
+        side by side. With `in_memory` frames are decoded straight into BGR
+        arrays; otherwise they are written as PNGs.
+
+        Returns:
+            (timestamp, future -> frame path/array or None) pairs, in order
+        """
+        video_str = os.fspath(video_path)  # Once, not per ffmpeg command
+        jobs = []
+        if in_memory:
+            for ts in timestamps[:self.max_frames]:
+                jobs.append((ts, pool.submit(self._grab_frame, video_str, ts)))
+            return jobs
+
         if output_dir is None:
             output_dir = self.temp_dir / "frames"
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        frame_paths = []
-
         for i, ts in enumerate(timestamps[:self.max_frames]):
-            output_path = output_dir / f"frame_{i:04d}_{ts:.1f}s.png"
-
-            cmd = [
-                "ffmpeg",
-                "-y",
-                "-ss", str(ts),
-                "-i", str(video_path),
-                "-frames:v", "1",
-                "-q:v", "2",
-                str(output_path),
-            ]
-
-            try:
-                subprocess.run(cmd, capture_output=True, check=True)
-                if output_path.exists():
-                    frame_paths.append(output_path)
-            except subprocess.CalledProcessError:
-                continue  # Skip failed frames
-
-        return frame_paths
-
-    def deduplicate_frames(self, frame_paths: list[Path]) -> list[Path]:
+            # Zero-padded milliseconds: sorts with the index and parses back with int()
+            output_path = output_dir / f"frame_{i:04d}_{int(ts * 1000):09d}.png"
+            jobs.append((ts, pool.submit(self._extract_frame, video_str, ts, output_path)))
+        return jobs
+
+    @staticmethod
+    def _grab_frame(video_path: str, ts: float):
+        """Decode the frame at `ts` into an HxWx3 BGR array; None if ffmpeg fails."""
+        # Uncompressed BMP rather than rawvideo: the header carries the output
+        # size, which differs from the coded size when ffmpeg autorotates
+        cmd = [
+            "ffmpeg",
+            "-ss", str(ts),
+            "-i", video_path,
+            "-frames:v", "1",
+            "-f", "image2pipe",
+            "-c:v", "bmp",
+            "-pix_fmt", "bgr24",  # Channel order PaddleOCR/RapidOCR/OpenCV expect
+            "-",
+        ]
+
+        result = subprocess.run(cmd, capture_output=True)
+        if result.returncode != 0 or not result.stdout:
+            return None  # Skip failed frames
+        return cv2.imdecode(np.frombuffer(result.stdout, np.uint8), cv2.IMREAD_COLOR)
+
+    @staticmethod
+    def _extract_frame(video_path: str, ts: float, output_path: Path) -> Path | None:
+        """Grab the frame at `ts` into `output_path`; None if ffmpeg fails."""
+        cmd = [
+            "ffmpeg",
+            "-y",
+            "-ss", str(ts),
+            "-i", video_path,
+            "-frames:v", "1",
+            "-q:v", "2",
+            os.fspath(output_path),
+        ]
+
+        try:
+            subprocess.run(cmd, capture_output=True, check=True)
+        except subprocess.CalledProcessError:
+            return None  # Skip failed frames
+        return output_path if output_path.exists() else None
+
+    def deduplicate_frames(self, frame_paths: list) -> list:
         """
         Remove near-duplicate frames using perceptual hashing.
 
         Args:
-            frame_paths: List of frame image paths
+            frame_paths: List of frame image paths or BGR arrays
 
         Returns:
             Filtered list with duplicates removed
         """
-        if not frame_paths or not IMAGEDEDUP_AVAILABLE:
-            return frame_paths
-
-        # Get directory containing frames
-        frame_dir = frame_paths[0].parent
-
-        phasher = PHash()
-        encodings = phasher.encode_images(image_dir=str(frame_dir))
-
-        # Find duplicates
-        duplicates = phasher.find_duplicates(
-            encoding_map=encodings,
-            max_distance_threshold=int((1 - self.dedup_threshold) * 64),  # Convert to hamming distance
-        )
-
-        # Build set of files to remove (keep first occurrence)
-        to_remove = set()
-        for original, dupes in duplicates.items():
-            to_remove.update(dupes)
-
-        # Filter frame paths
-        return [p for p in frame_paths if p.name not in to_remove]
-
-    def ocr_frame(self, frame_path: Path) -> tuple[str, float]:
+        to_remove = self._duplicate_indices(frame_paths)
+        return [p for i, p in enumerate(frame_paths) if i not in to_remove]
+
+    def _duplicate_indices(self, frames: list) -> set[int]:
+        """Indices of frames that nearly match an earlier frame."""
+        if not frames or not OPENCV_AVAILABLE:
+            return set()
+
+        hashes = [_phash64(f) for f in frames]
+        hashed = [i for i, h in enumerate(hashes) if h is not None]
+        if len(hashed) < 2:
+            return set()
+
+        codes = np.array([hashes[i] for i in hashed], dtype=np.uint64)
+
+        # A frame is a duplicate if it's close to any earlier frame (keep first occurrence)
+        max_distance = int((1 - self.dedup_threshold) * 64)  # Convert to hamming distance
+        if len(codes) > _DENSE_DEDUP_MAX_FRAMES and max_distance < 16:
+            duplicates = _close_to_earlier_banded(codes, max_distance)
+        else:
+            distances = _popcount64(codes[:, None] ^ codes[None, :])
+            close = np.triu(distances <= max_distance, k=1)
+            duplicates = np.flatnonzero(close.any(axis=0)).tolist()
+        # Unreadable frames are kept and left for OCR to judge
+        return {hashed[j] for j in duplicates}
+
+    def ocr_frame(self, frame_path) -> tuple[str, float]:
         """
         Extract text from a frame using OCR.
 
         Args:
-            frame_path: Path to frame image
+            frame_path: Path to frame image, or the frame as a BGR array
 
         Returns:
             Tuple of (extracted_text, average_confidence)
         """
-        result = self.ocr_model.ocr(str(frame_path), cls=True)
+        # Both engines take a file path or an in-memory BGR array
+        image = os.fspath(frame_path) if isinstance(frame_path, (str, os.PathLike)) else frame_path
 
-        if not result or not result[0]:
-            return "", 0.0
+        if self.ocr_engine == "rapidocr":
+            # Returns ([[box, text, score], ...] or None, timings)
+            result, _ = self.ocr_model(image)
+            pairs = [(text, float(conf)) for _box, text, conf in result or []]
+        else:
+            result = self.ocr_model.ocr(image, cls=True)
+            if not result or not result[0]:
+                return "", 0.0
 
-        texts = []
-        confidences = []
+            # Each line is [box, (text, confidence)]
+            pairs = [line[1] for line in result[0] if line and len(line) >= 2]
 
-        for line in result[0]:
-            if line and len(line) >= 2:
-                text = line[1][0]
-                conf = line[1][1]
-                texts.append(text)
-                confidences.append(conf)
+        texts = [text for text, _conf in pairs]
+        confidences = [conf for _text, conf in pairs]
 
         full_text = " ".join(texts)
-        avg_conf = sum(confidences) / len(confidences) if confidences else 0.0
+        avg_conf = statistics.fmean(confidences) if confidences else 0.0
 
         return full_text, avg_conf
 
+    def _frame_content(self, index: int, ts: float, frame) -> FrameContent:
+        """OCR one extracted frame (path or array) into a FrameContent."""
+        ocr_text, confidence = self.ocr_frame(frame)
+
+        return FrameContent(
+            timestamp=ts,
+            frame_path=frame if isinstance(frame, Path) else None,
+            ocr_text=ocr_text,
+            confidence=confidence,
+            scene_index=index,
+        )
+
     def extract(
         self,
         url: str,
@@ -320,61 +471,66 @@ class VisualExtractor:
                 progress_callback("Downloading video...")
             video_path = self.download_video(url)
 
-            # Detect scenes
-            if progress_callback:
-                progress_callback("Detecting scenes...")
-            scenes = self.detect_scenes(video_path)
-
-            # Get timestamps (middle of each scene)
-            timestamps = [(s[0] + s[1]) / 2 for s in scenes]
+            with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as pool:
+                # ffprobe runs while OpenCV scans the video for scene changes
+                probe_future = pool.submit(self._probe_duration, video_path)
 
-            # If no scenes detected, sample at regular intervals
-            if not timestamps:
-                # Get video duration
-                cmd = ["ffprobe", "-v", "error", "-show_entries", "format=duration",
-                       "-of", "default=noprint_wrappers=1:nokey=1", str(video_path)]
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                duration = float(result.stdout.strip())
+                # Detect scenes
+                if progress_callback:
+                    progress_callback("Detecting scenes...")
+                scenes = self.detect_scenes(video_path)
+                duration = probe_future.result()
 
-                # Sample every 30 seconds
-                timestamps = list(range(0, int(duration), 30))
+                # Get timestamps (middle of each scene)
+                timestamps = [(s[0] + s[1]) / 2 for s in scenes]
 
-            # Extract frames
-            if progress_callback:
-                progress_callback(f"Extracting {len(timestamps)} frames...")
-            frame_paths = self.extract_frames(video_path, timestamps)
-            total_extracted = len(frame_paths)
+                # If no scenes detected, sample at regular intervals
+                if not timestamps:
+                    # Sample every 30 seconds
+                    timestamps = list(range(0, int(duration), 30))
 
-            # Deduplicate
-            if self.deduplicate and frame_paths:
+                # Extract frames
                 if progress_callback:
-                    progress_callback("Removing duplicate frames...")
-                frame_paths = self.deduplicate_frames(frame_paths)
+                    progress_callback(f"Extracting {len(timestamps)} frames...")
+                # Frames go straight from ffmpeg into memory unless they are
+                # to be kept on disk
+                jobs = self._submit_frames(
+                    pool, video_path, timestamps,
+                    in_memory=OPENCV_AVAILABLE and not keep_frames,
+                )
 
-            # OCR each frame
-            if progress_callback:
-                progress_callback(f"Running OCR on {len(frame_paths)} frames...")
-
-            frames = []
-            for i, frame_path in enumerate(frame_paths):
-                # Extract timestamp from filename
-                ts = float(frame_path.stem.split('_')[-1].replace('s', ''))
-
-                ocr_text, confidence = self.ocr_frame(frame_path)
-
-                frames.append(FrameContent(
-                    timestamp=ts,
-                    frame_path=frame_path,
-                    ocr_text=ocr_text,
-                    confidence=confidence,
-                    scene_index=i,
-                ))
-
-            # Get video duration for result
-            cmd = ["ffprobe", "-v", "error", "-show_entries", "format=duration",
-                   "-of", "default=noprint_wrappers=1:nokey=1", str(video_path)]
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            duration = float(result.stdout.strip()) if result.stdout.strip() else 0.0
+                if self.deduplicate:
+                    grabbed = [(ts, frame) for ts, grab in jobs if (frame := grab.result()) is not None]
+                    frame_paths = [frame for _ts, frame in grabbed if isinstance(frame, Path)]
+                    total_extracted = len(grabbed)
+
+                    # Deduplicate
+                    if grabbed:
+                        if progress_callback:
+                            progress_callback("Removing duplicate frames...")
+                        duplicates = self._duplicate_indices([frame for _ts, frame in grabbed])
+                        grabbed = [g for i, g in enumerate(grabbed) if i not in duplicates]
+
+                    # OCR each frame
+                    if progress_callback:
+                        progress_callback(f"Running OCR on {len(grabbed)} frames...")
+                    frames = [
+                        self._frame_content(i, ts, frame) for i, (ts, frame) in enumerate(grabbed)
+                    ]
+                else:
+                    # Nothing to wait for between grab and OCR: read each frame
+                    # as soon as it lands while later grabs keep running
+                    if progress_callback:
+                        progress_callback(f"Running OCR on up to {len(jobs)} frames...")
+                    frames = []
+                    for ts, grab in jobs:
+                        frame = grab.result()
+                        if frame is None:
+                            continue
+                        if isinstance(frame, Path):
+                            frame_paths.append(frame)
+                        frames.append(self._frame_content(len(frames), ts, frame))
+                    total_extracted = len(frames)
 
             return VisualResult(
                 frames=frames,
@@ -6,11 +6,23 @@ Provider-agnostic, free-first. Two code paths:
 - Everything else via one OpenAI-compatible adapter with a per-provider
   base_url (OpenAI, OpenRouter free models, local Ollama) plus a native
   Anthropic path.
+
+Transcripts past ~100k tokens are summarized in parts and then combined
+(see summarize_mapreduce).
 """
 
+import asyncio
+import hashlib
+import json
 import os
+import random
+import time
 from pathlib import Path
 
+from .summarize_mapreduce import needs_mapreduce, summarize_mapreduce
+from .summarize_ratelimit import TokenBucket, estimate_tokens
+from .utils import CACHE_DIR
+
 
 class SummarizationError(Exception):
     """Error during summarization."""
@@ -44,6 +56,15 @@ A concise 2-3 paragraph summary capturing the essence of the video.
 {transcript}
 """
 
+# Split around the placeholder so prompts are one join, with no format() pass
+SUMMARY_PROMPT_HEAD, SUMMARY_PROMPT_TAIL = SUMMARY_PROMPT.split("{transcript}")
+
+
+def build_prompt(transcript_text: str, preamble: str = "") -> str:
+    """SUMMARY_PROMPT filled with `transcript_text`, optionally prefixed."""
+    return "".join((preamble, SUMMARY_PROMPT_HEAD, transcript_text, SUMMARY_PROMPT_TAIL))
+
+
 # Provider registry.
 #   kind: "gemini" (native SDK) | "anthropic" (native SDK) | "openai_compat"
 #   base_url: only for openai_compat (None = api.openai.com)
@@ -55,6 +76,7 @@ PROVIDERS = {
         "default_model": "gemini-flash-latest",
         "label": "Google Gemini",
         "requires_key": True,
+        "context_tokens": 1_048_576,
     },
     "openai": {
         "kind": "openai_compat",
@@ -63,6 +85,7 @@ PROVIDERS = {
         "base_url": None,
         "label": "OpenAI",
         "requires_key": True,
+        "context_tokens": 400_000,
     },
     "anthropic": {
         "kind": "anthropic",
@@ -70,6 +93,7 @@ PROVIDERS = {
         "default_model": "claude-opus-4-8",
         "label": "Anthropic",
         "requires_key": True,
+        "context_tokens": 200_000,
     },
     "openrouter": {
         "kind": "openai_compat",
@@ -102,6 +126,26 @@ def get_provider_info(provider: str) -> dict:
     })
 
 
+# Finished summaries keyed by provider, model and the exact prompt sent
+SUMMARY_CACHE_DIR = CACHE_DIR / "summaries"
+
+# Context window assumed for providers without "context_tokens" (OpenRouter's
+# free router, local Ollama models, custom endpoints): their window depends on
+# the model, and free/local models are often 32k
+DEFAULT_CONTEXT_TOKENS = 32_768
+
+# Seconds between progress updates while a streamed summary arrives
+STREAM_REPORT_INTERVAL = 2
+
+# Seconds between status checks while a provider batch job runs
+BATCH_POLL_INTERVAL = 30
+
+# Transient provider errors are retried this many times in total, sleeping
+# a random 1s..(2^attempt)s between tries (capped), or longer if the
+# server sends Retry-After
+RETRY_ATTEMPTS = 4
+RETRY_MAX_DELAY = 30
+
 # Free-tier models get overloaded (503) or rate-limited (429); trying the
 # next-best free model is usually enough to get a result.
 GEMINI_FALLBACK_MODELS = ["gemini-flash-latest", "gemini-2.5-flash", "gemini-2.5-flash-lite"]
@@ -113,18 +157,144 @@ def is_gemini_transient_error(error: Exception) -> bool:
     return any(marker in text for marker in ("503", "UNAVAILABLE", "429", "RESOURCE_EXHAUSTED"))
 
 
+def is_transient_error(error: Exception) -> bool:
+    """True for rate limits, overloads, timeouts and dropped connections."""
+    status = getattr(error, "status_code", None) or getattr(error, "code", None)
+    if isinstance(status, int) and (status in (408, 409, 429) or status >= 500):
+        return True
+    names = {cls.__name__ for cls in type(error).__mro__}
+    if names & {"APIConnectionError", "APITimeoutError", "TimeoutException", "NetworkError"}:
+        return True
+    return is_gemini_transient_error(error)
+
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    delay = random.uniform(1, min(RETRY_MAX_DELAY, 2 ** (attempt + 1)))
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        delay = max(delay, float(headers.get("retry-after")))
+    except (TypeError, ValueError):
+        pass  # No (numeric) Retry-After
+    return min(delay, RETRY_MAX_DELAY)
+
+
+def _with_retries(request, label: str, progress_callback: callable = None, attempts: int = RETRY_ATTEMPTS):
+    """Call `request()`, retrying transient errors with jittered backoff."""
+    for attempt in range(attempts):
+        try:
+            return request()
+        except SummarizationError:
+            raise
+        except Exception as e:
+            if attempt == attempts - 1 or not is_transient_error(e):
+                raise
+            delay = _retry_delay(e, attempt)
+            if progress_callback:
+                progress_callback(f"{label} busy ({type(e).__name__}), retrying in {delay:.0f}s...")
+            time.sleep(delay)
+
+
+async def _awith_retries(request, label: str, progress_callback: callable = None, attempts: int = RETRY_ATTEMPTS):
+    """Async variant of _with_retries(); `request` is a coroutine function."""
+    for attempt in range(attempts):
+        try:
+            return await request()
+        except SummarizationError:
+            raise
+        except Exception as e:
+            if attempt == attempts - 1 or not is_transient_error(e):
+                raise
+            delay = _retry_delay(e, attempt)
+            if progress_callback:
+                progress_callback(f"{label} busy ({type(e).__name__}), retrying in {delay:.0f}s...")
+            await asyncio.sleep(delay)
+
+
 def gemini_model_chain(preferred: str) -> list[str]:
     """Preferred model first, then the free fallback chain (deduplicated)."""
     return list(dict.fromkeys([preferred, *GEMINI_FALLBACK_MODELS]))
 
 
+# One pooled HTTP client per SDK module, shared by its sync clients
+_HTTP_CLIENTS = {}
+
+
+def _get_http_client(sdk):
+    """Process-wide HTTP client for the sync clients of `sdk` (openai/anthropic).
+
+    Reusing one connection pool keeps TLS sessions alive across summarizer
+    instances (one per file). Built from the SDK's own DefaultHttpxClient so
+    its timeouts and limits still apply; HTTP/2 when the optional h2 package
+    is installed. Async clients keep their own pools, since an async HTTP
+    client is bound to the event loop that created it.
+    """
+    if sdk.__name__ not in _HTTP_CLIENTS:
+        import importlib.util
+
+        _HTTP_CLIENTS[sdk.__name__] = sdk.DefaultHttpxClient(
+            http2=importlib.util.find_spec("h2") is not None,
+        )
+    return _HTTP_CLIENTS[sdk.__name__]
+
+
+def _throttle(rate_limiter: TokenBucket | None, prompt: str) -> None:
+    if rate_limiter is not None:
+        rate_limiter.acquire(estimate_tokens(prompt))
+
+
+async def _athrottle(rate_limiter: TokenBucket | None, prompt: str) -> None:
+    if rate_limiter is not None:
+        await rate_limiter.aacquire(estimate_tokens(prompt))
+
+
+def _needs_parts(transcript_text: str, prompt: str, provider: str, summarizer) -> bool:
+    """True if the transcript should be summarized via summarize_mapreduce().
+
+    Besides long transcripts, that covers a prompt which, with the output
+    budget, won't fit the provider's context window (DEFAULT_CONTEXT_TOKENS
+    where it varies by model); checked client-side so it is split up front
+    rather than uploaded only to be rejected or silently truncated.
+    """
+    if needs_mapreduce(transcript_text):
+        return True
+    context_tokens = get_provider_info(provider).get("context_tokens", DEFAULT_CONTEXT_TOKENS)
+    return estimate_tokens(prompt) > context_tokens - (summarizer._max_output_tokens or 0)
+
+
+def _collect_stream(pieces, progress_callback: callable = None) -> str:
+    """Join streamed text pieces, reporting progress every few seconds."""
+    buffer = []
+    received = 0
+    next_report = time.monotonic() + STREAM_REPORT_INTERVAL
+    for piece in pieces:
+        if not piece:
+            continue
+        buffer.append(piece)
+        received += len(piece)
+        if progress_callback and time.monotonic() >= next_report:
+            progress_callback(f"Receiving summary ({received:,} characters so far)...")
+            next_report = time.monotonic() + STREAM_REPORT_INTERVAL
+    return "".join(buffer)
+
+
 class GeminiSummarizer:
     """Summarize transcripts using the Google Gemini API (native SDK)."""
 
-    def __init__(self, api_key: str | None = None, model: str = "gemini-flash-latest"):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        model: str = "gemini-flash-latest",
+        rate_limiter: TokenBucket | None = None,
+        max_output_tokens: int | None = None,
+    ):
         self._api_key = api_key or os.environ.get("GEMINI_API_KEY")
         self._model = model
+        self._rate_limiter = rate_limiter
+        # Thinking tokens count against this budget on 2.5+ models
+        self._max_output_tokens = max_output_tokens or 16384
+        self.answered_model = None  # Model behind the latest summary (may be a fallback)
         self._client = None
+        self._generate_config = None
 
     @property
     def client(self):
@@ -145,37 +315,122 @@ class GeminiSummarizer:
                 )
         return self._client
 
-    def summarize(self, transcript_text: str, progress_callback: callable = None) -> str:
-        from google.genai.types import GenerateContentConfig
+    @property
+    def generate_config(self):
+        """Request config, built once; it is the same for every call."""
+        if self._generate_config is None:
+            from google.genai.types import GenerateContentConfig
+
+            self._generate_config = GenerateContentConfig(max_output_tokens=self._max_output_tokens)
+        return self._generate_config
+
+    def summarize(
+        self,
+        transcript_text: str,
+        progress_callback: callable = None,
+        prompt: str | None = None,
+        stream: bool = False,
+    ) -> str:
+        if prompt is None:
+            prompt = build_prompt(transcript_text)
+        models = gemini_model_chain(self._model)
+        last_error = None
+
+        def request(model: str) -> str:
+            _throttle(self._rate_limiter, prompt)
+            if stream:
+                chunks = self.client.models.generate_content_stream(
+                    model=model,
+                    contents=prompt,
+                    config=self.generate_config,
+                )
+                return self._checked_text(
+                    _collect_stream((chunk.text for chunk in chunks), progress_callback)
+                )
+            response = self.client.models.generate_content(
+                model=model,
+                contents=prompt,
+                config=self.generate_config,
+            )
+            return self._checked_text(response.text)
+
+        for model in models:
+            if progress_callback:
+                progress_callback(f"Generating summary with Gemini ({model})...")
+            try:
+                # Overloaded models hand over to the next one; only the last retries
+                summary = _with_retries(
+                    lambda: request(model), "Gemini", progress_callback,
+                    attempts=RETRY_ATTEMPTS if model == models[-1] else 1,
+                )
+                self.answered_model = model
+                return summary
+            except SummarizationError:
+                raise
+            except Exception as e:
+                last_error = e
+                if self._try_next_model(e, model, models, progress_callback):
+                    continue
+                raise SummarizationError(f"Gemini API error: {e}") from e
+
+        raise SummarizationError(f"Gemini API error: {last_error}") from last_error
 
-        prompt = SUMMARY_PROMPT.format(transcript=transcript_text)
+    async def asummarize(
+        self,
+        transcript_text: str,
+        progress_callback: callable = None,
+        prompt: str | None = None,
+    ) -> str:
+        """Async variant of summarize() on the client's aio interface."""
+        if prompt is None:
+            prompt = build_prompt(transcript_text)
         models = gemini_model_chain(self._model)
         last_error = None
 
+        async def request(model: str) -> str:
+            await _athrottle(self._rate_limiter, prompt)
+            response = await self.client.aio.models.generate_content(
+                model=model,
+                contents=prompt,
+                config=self.generate_config,
+            )
+            return self._checked_text(response.text)
+
         for model in models:
             if progress_callback:
                 progress_callback(f"Generating summary with Gemini ({model})...")
             try:
-                response = self.client.models.generate_content(
-                    model=model,
-                    contents=prompt,
-                    config=GenerateContentConfig(max_output_tokens=16384),
+                summary = await _awith_retries(
+                    lambda: request(model), "Gemini", progress_callback,
+                    attempts=RETRY_ATTEMPTS if model == models[-1] else 1,
                 )
-                if not response.text:
-                    raise SummarizationError("Gemini returned an empty response")
-                return response.text.strip()
+                self.answered_model = model
+                return summary
             except SummarizationError:
                 raise
             except Exception as e:
                 last_error = e
-                if is_gemini_transient_error(e) and model != models[-1]:
-                    if progress_callback:
-                        progress_callback(f"{model} overloaded/rate-limited, trying next model...")
+                if self._try_next_model(e, model, models, progress_callback):
                     continue
                 raise SummarizationError(f"Gemini API error: {e}") from e
 
         raise SummarizationError(f"Gemini API error: {last_error}") from last_error
 
+    @staticmethod
+    def _checked_text(text: str | None) -> str:
+        if not text:
+            raise SummarizationError("Gemini returned an empty response")
+        return text.strip()
+
+    @staticmethod
+    def _try_next_model(error: Exception, model: str, models: list[str], progress_callback) -> bool:
+        """True if `error` is transient and a fallback model is left to try."""
+        if is_gemini_transient_error(error) and model != models[-1]:
+            if progress_callback:
+                progress_callback(f"{model} overloaded/rate-limited, trying next model...")
+            return True
+        return False
+
 
 class OpenAICompatSummarizer:
     """Summarize via any OpenAI-compatible endpoint (OpenAI, OpenRouter, Ollama, ...)."""
@@ -185,6 +440,8 @@ class OpenAICompatSummarizer:
         provider: str,
         api_key: str | None = None,
         model: str | None = None,
+        rate_limiter: TokenBucket | None = None,
+        max_output_tokens: int | None = None,
     ):
         info = get_provider_info(provider)
         self._provider = provider
@@ -193,102 +450,419 @@ class OpenAICompatSummarizer:
         self._requires_key = info.get("requires_key", True)
         self._api_key = api_key or os.environ.get(info["env_var"])
         self._model = model or info["default_model"]
+        self._rate_limiter = rate_limiter
+        self._max_output_tokens = max_output_tokens  # None = the server's default
         self._client = None
+        self._aclient = None
+
+    def _new_client(self, client_class: str):
+        """Build an openai.OpenAI or openai.AsyncOpenAI for this provider."""
+        is_async = client_class.startswith("Async")
+        if self._requires_key and not self._api_key:
+            info = get_provider_info(self._provider)
+            raise SummarizationError(
+                f"No {self._label} API key provided. Set {info['env_var']}, "
+                "pass --api-key flag, or configure in config.yaml"
+            )
+        try:
+            import openai
+
+            return getattr(openai, client_class)(
+                api_key=self._api_key or "not-needed",
+                base_url=self._base_url,
+                max_retries=0,  # Retried by _with_retries(), not on top of it
+                http_client=None if is_async else _get_http_client(openai),
+            )
+        except ImportError:
+            raise SummarizationError(
+                "openai package not installed. Run: pip install openai"
+            )
 
     @property
     def client(self):
         if self._client is None:
-            if self._requires_key and not self._api_key:
-                info = get_provider_info(self._provider)
-                raise SummarizationError(
-                    f"No {self._label} API key provided. Set {info['env_var']}, "
-                    "pass --api-key flag, or configure in config.yaml"
-                )
-            try:
-                import openai
-
-                self._client = openai.OpenAI(
-                    api_key=self._api_key or "not-needed",
-                    base_url=self._base_url,
-                )
-            except ImportError:
-                raise SummarizationError(
-                    "openai package not installed. Run: pip install openai"
-                )
+            self._client = self._new_client("OpenAI")
         return self._client
 
-    def summarize(self, transcript_text: str, progress_callback: callable = None) -> str:
+    @property
+    def aclient(self):
+        """Async client, shared by every asummarize() call on this instance."""
+        if self._aclient is None:
+            self._aclient = self._new_client("AsyncOpenAI")
+        return self._aclient
+
+    def summarize(
+        self,
+        transcript_text: str,
+        progress_callback: callable = None,
+        prompt: str | None = None,
+        stream: bool = False,
+    ) -> str:
         if progress_callback:
             progress_callback(f"Generating summary with {self._label} ({self._model})...")
 
-        prompt = SUMMARY_PROMPT.format(transcript=transcript_text)
+        if prompt is None:
+            prompt = build_prompt(transcript_text)
+
+        def request() -> str:
+            _throttle(self._rate_limiter, prompt)
+            if stream:
+                chunks = self.client.chat.completions.create(
+                    model=self._model,
+                    messages=[{"role": "user", "content": prompt}],
+                    stream=True,
+                    **self._limit_kwargs(),
+                )
+                return self._checked_text(_collect_stream(
+                    (chunk.choices[0].delta.content for chunk in chunks if chunk.choices),
+                    progress_callback,
+                ))
+            response = self.client.chat.completions.create(
+                model=self._model,
+                messages=[{"role": "user", "content": prompt}],
+                **self._limit_kwargs(),
+            )
+            return self._checked_text(response.choices[0].message.content)
 
         try:
-            response = self.client.chat.completions.create(
+            return _with_retries(request, self._label, progress_callback)
+        except SummarizationError:
+            raise
+        except Exception as e:
+            raise SummarizationError(f"{self._label} API error: {e}") from e
+
+    async def asummarize(
+        self,
+        transcript_text: str,
+        progress_callback: callable = None,
+        prompt: str | None = None,
+    ) -> str:
+        """Async variant of summarize()."""
+        if progress_callback:
+            progress_callback(f"Generating summary with {self._label} ({self._model})...")
+
+        if prompt is None:
+            prompt = build_prompt(transcript_text)
+
+        async def request() -> str:
+            await _athrottle(self._rate_limiter, prompt)
+            response = await self.aclient.chat.completions.create(
                 model=self._model,
                 messages=[{"role": "user", "content": prompt}],
+                **self._limit_kwargs(),
             )
-            content = response.choices[0].message.content
-            if not content:
-                raise SummarizationError(f"{self._label} returned an empty response")
-            return content.strip()
+            return self._checked_text(response.choices[0].message.content)
+
+        try:
+            return await _awith_retries(request, self._label, progress_callback)
         except SummarizationError:
             raise
         except Exception as e:
             raise SummarizationError(f"{self._label} API error: {e}") from e
 
+    def _limit_kwargs(self) -> dict:
+        """Output cap in the parameter this endpoint understands."""
+        if self._max_output_tokens is None:
+            return {}
+        # api.openai.com rejects max_tokens for reasoning models; other
+        # OpenAI-compatible servers only know max_tokens
+        key = "max_completion_tokens" if self._base_url is None else "max_tokens"
+        return {key: self._max_output_tokens}
+
+    def _checked_text(self, content: str | None) -> str:
+        if not content:
+            raise SummarizationError(f"{self._label} returned an empty response")
+        return content.strip()
+
+    def summarize_batch(
+        self,
+        transcripts: list[str],
+        progress_callback: callable = None,
+        poll_interval: float = BATCH_POLL_INTERVAL,
+    ) -> list[str | None]:
+        """Summarize many transcripts as one OpenAI Batch API job.
+
+        Half the price of individual requests, but results can take up to
+        24h; only for offline runs. Blocks until the job finishes.
+
+        Returns:
+            Summaries in the same order as `transcripts`, None where that
+            request failed (the rest of the paid-for job is still returned)
+        """
+        if self._base_url is not None:
+            raise SummarizationError(f"{self._label} does not support the OpenAI Batch API")
+
+        lines = [
+            json.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self._model,
+                    "messages": [{"role": "user", "content": build_prompt(text)}],
+                    **self._limit_kwargs(),
+                },
+            })
+            for i, text in enumerate(transcripts)
+        ]
+
+        # SDK retries are off (see _new_client), so every call goes through _with_retries()
+        try:
+            batch_file = _with_retries(
+                lambda: self.client.files.create(
+                    file=("summaries.jsonl", "\n".join(lines).encode("utf-8")),
+                    purpose="batch",
+                ),
+                self._label, progress_callback,
+            )
+            batch = _with_retries(
+                lambda: self.client.batches.create(
+                    input_file_id=batch_file.id,
+                    endpoint="/v1/chat/completions",
+                    completion_window="24h",
+                ),
+                self._label, progress_callback,
+            )
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                if progress_callback:
+                    progress_callback(f"{self._label} batch {batch.id}: {batch.status}...")
+                time.sleep(poll_interval)
+                batch = _with_retries(
+                    lambda: self.client.batches.retrieve(batch.id), self._label, progress_callback
+                )
+
+            if batch.status != "completed":
+                raise SummarizationError(f"{self._label} batch {batch.id} {batch.status}")
+
+            results = {}
+            if batch.output_file_id:
+                output = _with_retries(
+                    lambda: self.client.files.content(batch.output_file_id).text,
+                    self._label, progress_callback,
+                )
+                for line in output.splitlines():
+                    if line.strip():
+                        item = json.loads(line)
+                        results[item["custom_id"]] = item
+        except SummarizationError:
+            raise
+        except Exception as e:
+            raise SummarizationError(f"{self._label} batch API error: {e}") from e
+
+        summaries = []
+        for i in range(len(transcripts)):
+            response = (results.get(str(i)) or {}).get("response") or {}
+            content = None
+            if response.get("status_code") == 200:
+                content = response["body"]["choices"][0]["message"]["content"]
+            summaries.append((content or "").strip() or None)  # Empty counts as failed
+        return summaries
+
 
 class AnthropicSummarizer:
     """Summarize transcripts using the Anthropic API (native SDK)."""
 
-    def __init__(self, api_key: str | None = None, model: str = "claude-opus-4-8"):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        model: str = "claude-opus-4-8",
+        rate_limiter: TokenBucket | None = None,
+        max_output_tokens: int | None = None,
+    ):
         self._api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
         self._model = model
+        self._rate_limiter = rate_limiter
+        self._max_output_tokens = max_output_tokens or 8192
         self._client = None
+        self._aclient = None
+
+    def _new_client(self, client_class: str):
+        """Build an anthropic.Anthropic or anthropic.AsyncAnthropic."""
+        is_async = client_class.startswith("Async")
+        if not self._api_key:
+            raise SummarizationError(
+                "No Anthropic API key provided. Set ANTHROPIC_API_KEY environment variable, "
+                "pass --api-key flag, or configure in config.yaml"
+            )
+        try:
+            import anthropic
+
+            return getattr(anthropic, client_class)(
+                api_key=self._api_key,
+                max_retries=0,  # Retried by _with_retries(), not on top of it
+                http_client=None if is_async else _get_http_client(anthropic),
+            )
+        except ImportError:
+            raise SummarizationError(
+                "anthropic package not installed. Run: pip install anthropic"
+            )
 
     @property
     def client(self):
         if self._client is None:
-            if not self._api_key:
-                raise SummarizationError(
-                    "No Anthropic API key provided. Set ANTHROPIC_API_KEY environment variable, "
-                    "pass --api-key flag, or configure in config.yaml"
-                )
-            try:
-                import anthropic
-
-                self._client = anthropic.Anthropic(api_key=self._api_key)
-            except ImportError:
-                raise SummarizationError(
-                    "anthropic package not installed. Run: pip install anthropic"
-                )
+            self._client = self._new_client("Anthropic")
         return self._client
 
-    def summarize(self, transcript_text: str, progress_callback: callable = None) -> str:
+    @property
+    def aclient(self):
+        """Async client, shared by every asummarize() call on this instance."""
+        if self._aclient is None:
+            self._aclient = self._new_client("AsyncAnthropic")
+        return self._aclient
+
+    def summarize(
+        self,
+        transcript_text: str,
+        progress_callback: callable = None,
+        prompt: str | None = None,
+        stream: bool = False,
+    ) -> str:
         if progress_callback:
             progress_callback(f"Generating summary with Anthropic ({self._model})...")
 
-        prompt = SUMMARY_PROMPT.format(transcript=transcript_text)
+        if prompt is None:
+            prompt = build_prompt(transcript_text)
+
+        def request() -> str:
+            _throttle(self._rate_limiter, prompt)
+            if stream:
+                with self.client.messages.stream(
+                    model=self._model,
+                    max_tokens=self._max_output_tokens,
+                    messages=[{"role": "user", "content": prompt}],
+                ) as events:
+                    text = _collect_stream(events.text_stream, progress_callback)
+                    if events.get_final_message().stop_reason == "refusal":
+                        raise SummarizationError("Anthropic declined to process this transcript")
+                return text.strip()
+            response = self.client.messages.create(
+                model=self._model,
+                max_tokens=self._max_output_tokens,
+                messages=[{"role": "user", "content": prompt}],
+            )
+            return self._response_text(response)
 
         try:
-            response = self.client.messages.create(
+            return _with_retries(request, "Anthropic", progress_callback)
+        except SummarizationError:
+            raise
+        except Exception as e:
+            raise SummarizationError(f"Anthropic API error: {e}") from e
+
+    async def asummarize(
+        self,
+        transcript_text: str,
+        progress_callback: callable = None,
+        prompt: str | None = None,
+    ) -> str:
+        """Async variant of summarize()."""
+        if progress_callback:
+            progress_callback(f"Generating summary with Anthropic ({self._model})...")
+
+        if prompt is None:
+            prompt = build_prompt(transcript_text)
+
+        async def request() -> str:
+            await _athrottle(self._rate_limiter, prompt)
+            response = await self.aclient.messages.create(
                 model=self._model,
-                max_tokens=8192,
+                max_tokens=self._max_output_tokens,
                 messages=[{"role": "user", "content": prompt}],
             )
-            if response.stop_reason == "refusal":
-                raise SummarizationError("Anthropic declined to process this transcript")
-            return response.content[0].text.strip()
+            return self._response_text(response)
+
+        try:
+            return await _awith_retries(request, "Anthropic", progress_callback)
         except SummarizationError:
             raise
         except Exception as e:
             raise SummarizationError(f"Anthropic API error: {e}") from e
 
+    @staticmethod
+    def _response_text(response) -> str:
+        if response.stop_reason == "refusal":
+            raise SummarizationError("Anthropic declined to process this transcript")
+        return response.content[0].text.strip()
+
+    def summarize_batch(
+        self,
+        transcripts: list[str],
+        progress_callback: callable = None,
+        poll_interval: float = BATCH_POLL_INTERVAL,
+    ) -> list[str | None]:
+        """Summarize many transcripts as one Message Batches job.
+
+        Half the price of individual requests, but results can take up to
+        24h; only for offline runs. Blocks until the job ends.
+
+        Returns:
+            Summaries in the same order as `transcripts`, None where that
+            request errored, expired or was refused
+        """
+        requests = [
+            {
+                "custom_id": str(i),
+                "params": {
+                    "model": self._model,
+                    "max_tokens": self._max_output_tokens,
+                    "messages": [{"role": "user", "content": build_prompt(text)}],
+                },
+            }
+            for i, text in enumerate(transcripts)
+        ]
+
+        # SDK retries are off (see _new_client), so every call goes through _with_retries()
+        try:
+            batch = _with_retries(
+                lambda: self.client.messages.batches.create(requests=requests),
+                "Anthropic", progress_callback,
+            )
+            while batch.processing_status != "ended":
+                if progress_callback:
+                    progress_callback(f"Anthropic batch {batch.id}: {batch.processing_status}...")
+                time.sleep(poll_interval)
+                batch = _with_retries(
+                    lambda: self.client.messages.batches.retrieve(batch.id), "Anthropic", progress_callback
+                )
+
+            results = _with_retries(
+                lambda: {
+                    entry.custom_id: entry.result
+                    for entry in self.client.messages.batches.results(batch.id)
+                },
+                "Anthropic", progress_callback,
+            )
+        except Exception as e:
+            raise SummarizationError(f"Anthropic batch API error: {e}") from e
+
+        summaries = []
+        for i in range(len(transcripts)):
+            result = results.get(str(i))
+            text = ""
+            if (
+                result is not None and result.type == "succeeded"
+                and result.message.stop_reason != "refusal" and result.message.content
+            ):
+                text = result.message.content[0].text.strip()
+            summaries.append(text or None)  # Empty counts as failed
+        return summaries
+
+
+# Summarizer class per PROVIDERS "kind"
+_SUMMARIZER_CLASSES = {
+    "gemini": GeminiSummarizer,
+    "anthropic": AnthropicSummarizer,
+    "openai_compat": OpenAICompatSummarizer,
+}
+
 
 def create_summarizer(
     provider: str = "gemini",
     api_key: str | None = None,
     model: str | None = None,
+    rpm: int | None = None,
+    tpm: int | None = None,
+    max_output_tokens: int | None = None,
 ):
     """Factory: create a summarizer for the given provider.
 
@@ -296,29 +870,38 @@ def create_summarizer(
         provider: Provider name (gemini, openai, anthropic, openrouter, ollama)
         api_key: API key (falls back to provider-specific env var)
         model: Model name (falls back to provider default)
+        rpm: Requests-per-minute cap to wait under (None = unlimited)
+        tpm: Prompt tokens-per-minute cap to wait under (None = unlimited)
+        max_output_tokens: Cap on generated tokens (None = provider default)
 
     Returns:
-        A summarizer instance with .summarize() method
+        A summarizer instance with .summarize() and async .asummarize() methods
     """
     info = get_provider_info(provider)
     resolved_model = model or info["default_model"]
     kind = info["kind"]
 
-    if kind == "gemini":
-        return GeminiSummarizer(api_key=api_key, model=resolved_model)
-    if kind == "anthropic":
-        return AnthropicSummarizer(api_key=api_key, model=resolved_model)
+    summarizer_class = _SUMMARIZER_CLASSES.get(kind)
+    if summarizer_class is None:
+        raise SummarizationError(
+            f"Unknown provider: {provider}. Supported: {', '.join(PROVIDERS.keys())}"
+        )
+
+    kwargs = {
+        "api_key": api_key,
+        "model": resolved_model,
+        "rate_limiter": TokenBucket(rpm=rpm, tpm=tpm) if rpm or tpm else None,
+        "max_output_tokens": max_output_tokens,
+    }
     if kind == "openai_compat":
         if not resolved_model:
             raise SummarizationError(
                 f"Unknown provider: {provider}. Supported: {', '.join(PROVIDERS.keys())} "
                 "(or pass --summarize-model for a custom OpenAI-compatible provider)"
             )
-        return OpenAICompatSummarizer(provider, api_key=api_key, model=resolved_model)
+        kwargs["provider"] = provider  # One adapter class serves several providers
 
-    raise SummarizationError(
-        f"Unknown provider: {provider}. Supported: {', '.join(PROVIDERS.keys())}"
-    )
+    return summarizer_class(**kwargs)
 
 
 def summarize_file(
@@ -328,6 +911,9 @@ def summarize_file(
     api_key: str | None = None,
     model: str | None = None,
     progress_callback: callable = None,
+    use_cache: bool = True,
+    stream: bool = False,
+    max_output_tokens: int | None = None,
 ) -> Path:
     """Summarize a transcript file and save the result.
 
@@ -338,26 +924,250 @@ def summarize_file(
         api_key: API key override
         model: Model name override
         progress_callback: Optional callback for progress updates
+        use_cache: Reuse the summary of an identical earlier request (kept in
+            ~/.cache/yt-comprehend/summaries)
+        stream: Receive the summary incrementally, reporting progress as it arrives
+        max_output_tokens: Cap on generated tokens (None = provider default)
 
     Returns:
         Path to the saved summary file
     """
+    transcript_text, output_path = _prepare_summary(transcript_path, output_path)
+
+    summarizer = create_summarizer(
+        provider=provider, api_key=api_key, model=model, max_output_tokens=max_output_tokens
+    )
+    # Formatted once here; the summarizer's retries and fallbacks reuse it
+    prompt = build_prompt(transcript_text)
+
+    cache_path = _summary_cache_path(provider, model, prompt, max_output_tokens) if use_cache else None
+    summary = _read_cached_summary(cache_path, progress_callback)
+    if summary is None:
+        if _needs_parts(transcript_text, prompt, provider, summarizer):
+            summary = asyncio.run(
+                summarize_mapreduce(summarizer, transcript_text, progress_callback=progress_callback)
+            )
+        else:
+            summary = summarizer.summarize(
+                transcript_text, progress_callback, prompt=prompt, stream=stream
+            )
+        if not _fell_back(summarizer):
+            _write_cached_summary(cache_path, summary)
+    _write_summary(output_path, summary)
+
+    return output_path
+
+
+async def summarize_files(
+    transcript_paths: list[str | Path],
+    provider: str = "gemini",
+    api_key: str | None = None,
+    model: str | None = None,
+    concurrency: int = 8,
+    rpm: int | None = None,
+    tpm: int | None = None,
+    progress_callback: callable = None,
+    use_cache: bool = True,
+    max_output_tokens: int | None = None,
+) -> list[Path]:
+    """Summarize several transcript files concurrently.
+
+    One summarizer (and so one client) serves the whole batch; at most
+    `concurrency` requests are in flight at a time. Summaries are saved
+    next to each transcript as in summarize_file().
+
+    Args:
+        transcript_paths: Transcript files to summarize
+        provider: LLM provider name
+        api_key: API key override
+        model: Model name override
+        concurrency: Maximum simultaneous provider requests
+        rpm: Requests-per-minute cap for the batch (None = unlimited)
+        tpm: Prompt tokens-per-minute cap for the batch (None = unlimited)
+        progress_callback: Optional callback for progress updates
+        use_cache: Reuse the summary of an identical earlier request
+        max_output_tokens: Cap on generated tokens (None = provider default)
+
+    Returns:
+        Paths to the saved summary files, in input order
+    """
+    summarizer = create_summarizer(
+        provider=provider, api_key=api_key, model=model, rpm=rpm, tpm=tpm,
+        max_output_tokens=max_output_tokens,
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def summarize_one(transcript_path) -> Path:
+        transcript_text, output_path = _prepare_summary(transcript_path)
+        prompt = build_prompt(transcript_text)
+
+        cache_path = _summary_cache_path(provider, model, prompt, max_output_tokens) if use_cache else None
+        summary = _read_cached_summary(cache_path, progress_callback)
+        if summary is None:
+            if _needs_parts(transcript_text, prompt, provider, summarizer):
+                summary = await summarize_mapreduce(
+                    summarizer, transcript_text,
+                    progress_callback=progress_callback, semaphore=semaphore,
+                )
+            else:
+                async with semaphore:
+                    summary = await summarizer.asummarize(
+                        transcript_text, progress_callback, prompt=prompt
+                    )
+            if not _fell_back(summarizer):
+                _write_cached_summary(cache_path, summary)
+        _write_summary(output_path, summary)
+        return output_path
+
+    return list(await asyncio.gather(*(summarize_one(p) for p in transcript_paths)))
+
+
+def summarize_files_batch(
+    transcript_paths: list[str | Path],
+    provider: str = "openai",
+    api_key: str | None = None,
+    model: str | None = None,
+    progress_callback: callable = None,
+    max_output_tokens: int | None = None,
+) -> list[Path]:
+    """Summarize several transcript files through the provider's Batch API.
+
+    Supported for OpenAI and Anthropic. It costs half as much as
+    summarize_files() but can take hours, so it suits offline runs.
+    Transcripts too long for a single request are rejected before the
+    job is created. Every summary that comes back is saved even if
+    others in the job failed; the failures are then raised together.
+
+    Args:
+        transcript_paths: Transcript files to summarize
+        provider: LLM provider name (openai or anthropic)
+        api_key: API key override
+        model: Model name override
+        progress_callback: Optional callback for progress updates
+        max_output_tokens: Cap on generated tokens (None = provider default)
+
+    Returns:
+        Paths to the saved summary files, in input order
+
+    Raises:
+        SummarizationError: If a transcript is too long for one request, or
+            after saving the rest, if any request in the job failed
+    """
+    summarizer = create_summarizer(
+        provider=provider, api_key=api_key, model=model, max_output_tokens=max_output_tokens
+    )
+    if not hasattr(summarizer, "summarize_batch"):
+        raise SummarizationError(f"Batch summarization is not supported for provider: {provider}")
+
+    prepared = [_prepare_summary(p) for p in transcript_paths]
+
+    # A batch request can't be split into parts, so these would only fail hours later
+    too_long = [
+        str(path) for path, (text, _) in zip(transcript_paths, prepared)
+        if _needs_parts(text, build_prompt(text), provider, summarizer)
+    ]
+    if too_long:
+        raise SummarizationError(
+            "Too long for a single batch request (summarize these individually): "
+            + ", ".join(too_long)
+        )
+
+    summaries = summarizer.summarize_batch([text for text, _ in prepared], progress_callback)
+
+    failed = []
+    for path, (_, output_path), summary in zip(transcript_paths, prepared, summaries):
+        if not summary:  # None (or empty) marks a failed request
+            failed.append(str(path))
+        else:
+            _write_summary(output_path, summary)
+    if failed:
+        raise SummarizationError(
+            f"{len(failed)} of {len(prepared)} batch summaries failed: {', '.join(failed)}"
+        )
+    return [output_path for _, output_path in prepared]
+
+
+def summarize_files_sync(transcript_paths: list[str | Path], **kwargs) -> list[Path]:
+    """Blocking wrapper around summarize_files() for non-async callers."""
+    return asyncio.run(summarize_files(transcript_paths, **kwargs))
+
+
+def _prepare_summary(
+    transcript_path: str | Path,
+    output_path: str | Path | None = None,
+) -> tuple[str, Path]:
+    """Read a transcript and resolve (and create) its summary's directory."""
     transcript_path = Path(transcript_path)
     if not transcript_path.exists():
         raise SummarizationError(f"Transcript file not found: {transcript_path}")
 
     transcript_text = transcript_path.read_text()
 
-    # Derive output path: /transcripts/ -> /summaries/
+    # Derive output path: .../transcripts/<name> -> .../summaries/<name>.md
     if output_path is None:
-        output_path = Path(str(transcript_path).replace("/transcripts/", "/summaries/"))
+        *dirs, name = transcript_path.parts
+        dirs = ["summaries" if part == "transcripts" else part for part in dirs]
+        output_path = Path(*dirs, name).with_suffix(".md")
     else:
         output_path = Path(output_path)
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    summarizer = create_summarizer(provider=provider, api_key=api_key, model=model)
-    summary = summarizer.summarize(transcript_text, progress_callback)
-    output_path.write_text(summary)
+    return transcript_text, output_path
 
-    return output_path
+
+def _write_summary(output_path: Path, summary: str) -> None:
+    """Save a summary atomically, so an interrupted write never leaves a partial file."""
+    tmp_path = output_path.with_suffix(f"{output_path.suffix}.{os.getpid()}.tmp")
+    tmp_path.write_text(summary)
+    os.replace(tmp_path, output_path)
+
+
+def _summary_cache_path(
+    provider: str,
+    model: str | None,
+    prompt: str,
+    max_output_tokens: int | None = None,
+) -> Path:
+    """Cache file for a summary of `prompt` by this provider/model."""
+    resolved_model = model or get_provider_info(provider)["default_model"]
+    digest = hashlib.sha256()
+    for part in (provider, resolved_model, str(max_output_tokens), prompt):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return SUMMARY_CACHE_DIR / f"{digest.hexdigest()}.md"
+
+
+def _fell_back(summarizer) -> bool:
+    """True if the latest summary came from a fallback model, not the requested one.
+
+    Those aren't cached: the key names the requested model, and the next
+    run should get another chance at it. Read right after the summarize
+    call returns, before another request on the summarizer can finish.
+    """
+    answered = getattr(summarizer, "answered_model", None)
+    return answered is not None and answered != summarizer._model
+
+
+def _read_cached_summary(cache_path: Path | None, progress_callback: callable = None) -> str | None:
+    if cache_path is None:
+        return None
+    try:
+        summary = cache_path.read_text(encoding="utf-8")
+    except OSError:
+        return None  # Not cached yet
+    if progress_callback:
+        progress_callback("Using cached summary (identical transcript and model)")
+    return summary
+
+
+def _write_cached_summary(cache_path: Path | None, summary: str) -> None:
+    if cache_path is None:
+        return
+    try:
+        SUMMARY_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(summary, encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # Cache is an optimization; never fail on it
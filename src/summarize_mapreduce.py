@@ -0,0 +1,121 @@
+"""Map-reduce summarization for very long transcripts.
+
+A multi-hour transcript in one prompt is slow to prefill and can hit
+long-context pricing or limits. Instead the transcript is split into
+consecutive parts, each part is condensed into notes concurrently (map),
+and the notes are summarized with the regular prompt (reduce).
+"""
+
+import asyncio
+
+from .summarize_ratelimit import estimate_tokens
+
+# Transcripts above this many (estimated) tokens are summarized in parts
+MAPREDUCE_THRESHOLD_TOKENS = 100_000
+
+MAP_PROMPT = """You are condensing part {index} of {total} of a long video transcript into notes for a later summary.
+
+List, in order, every topic covered in this part with its key points, plus any tools, technologies, people, books, resources, or links mentioned. Keep concrete details (numbers, names, steps); skip filler. Use markdown bullets and no preamble.
+
+---
+
+## Transcript part {index} of {total}:
+
+{transcript}
+"""
+
+REDUCE_PREAMBLE = """The transcript below was too long to read at once, so it was split into consecutive parts and each part was condensed into notes. The notes cover the whole video in order; treat them as the transcript.
+
+"""
+
+
+def split_transcript(text: str, target_tokens: int = 8000) -> list[str]:
+    """Split text into consecutive chunks of roughly `target_tokens` each.
+
+    Breaks fall on line boundaries; a single line longer than a chunk is
+    cut at the character limit.
+    """
+    target_chars = target_tokens * 4  # Same ~4 chars/token estimate as the rate limiter
+    chunks = []
+    current = []
+    size = 0
+
+    for line in text.splitlines(keepends=True):
+        while len(line) > target_chars:
+            if current:
+                chunks.append("".join(current))
+                current, size = [], 0
+            chunks.append(line[:target_chars])
+            line = line[target_chars:]
+        if size + len(line) > target_chars and current:
+            chunks.append("".join(current))
+            current, size = [], 0
+        current.append(line)
+        size += len(line)
+
+    if current:
+        chunks.append("".join(current))
+    return [chunk for chunk in chunks if chunk.strip()]
+
+
+def needs_mapreduce(transcript_text: str) -> bool:
+    """True if the transcript is long enough to summarize in parts."""
+    return estimate_tokens(transcript_text) > MAPREDUCE_THRESHOLD_TOKENS
+
+
+async def summarize_mapreduce(
+    summarizer,
+    transcript_text: str,
+    target_tokens: int = 8000,
+    concurrency: int = 8,
+    progress_callback: callable = None,
+    semaphore: asyncio.Semaphore | None = None,
+) -> str:
+    """Summarize a long transcript via concurrent partial notes and a final pass.
+
+    Args:
+        summarizer: Any summarizer from create_summarizer()
+        transcript_text: Full transcript text
+        target_tokens: Approximate size of each part
+        concurrency: Maximum simultaneous part requests
+        progress_callback: Optional callback for progress updates
+        semaphore: Caller's request limit to share (replaces `concurrency`),
+            so parts of several transcripts stay under one cap
+
+    Returns:
+        Summary in the same format as a one-shot summary. If any part was
+        answered by a fallback model, `summarizer.answered_model` names it
+        afterwards (not just the model of the final pass), so callers can
+        tell the summary is not purely the requested model's.
+    """
+    from .summarize import build_prompt
+
+    parts = split_transcript(transcript_text, target_tokens)
+    if progress_callback:
+        progress_callback(f"Long transcript: condensing {len(parts)} parts in parallel...")
+
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(concurrency)
+
+    answered = []  # Model behind each part, for summarizers that report one
+
+    async def condense(index: int, part: str) -> str:
+        prompt = MAP_PROMPT.format(index=index, total=len(parts), transcript=part)
+        async with semaphore:
+            note = await summarizer.asummarize(part, prompt=prompt)
+            answered.append(getattr(summarizer, "answered_model", None))
+            return note
+
+    notes = await asyncio.gather(*(condense(i, part) for i, part in enumerate(parts, 1)))
+
+    joined = "\n\n".join(
+        f"### Part {i} of {len(parts)}\n\n{note}" for i, note in enumerate(notes, 1)
+    )
+    prompt = build_prompt(joined, preamble=REDUCE_PREAMBLE)
+    async with semaphore:
+        summary = await summarizer.asummarize(joined, progress_callback, prompt=prompt)
+
+    fallback = next((m for m in answered if m not in (None, summarizer._model)), None)
+    if fallback is not None:
+        summarizer.answered_model = fallback
+    return summary
@@ -0,0 +1,73 @@
+"""Client-side rate limiting for summarization requests.
+
+Providers enforce requests-per-minute and tokens-per-minute quotas and
+answer bursts with 429s. Waiting for capacity before sending keeps a
+batch of requests under the quota instead of retrying after the fact.
+"""
+
+import asyncio
+import threading
+import time
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough prompt size in tokens (~4 characters per token)."""
+    return len(text) // 4 + 1
+
+
+class TokenBucket:
+    """Preemptive RPM/TPM limiter shared by sync and async callers.
+
+    Each limit is a bucket that refills continuously at limit/60 per
+    second up to one minute's worth. A request takes one unit from the
+    request bucket and its estimated token count from the token bucket,
+    waiting until both have enough.
+    """
+
+    def __init__(self, rpm: float | None = None, tpm: float | None = None):
+        """
+        Args:
+            rpm: Requests per minute, or None for no request limit
+            tpm: Tokens per minute, or None for no token limit
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm or 0)
+        self._tokens = float(tpm or 0)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: int) -> float:
+        """Take capacity and return 0.0, or return seconds to wait first."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._updated = now
+
+            wait = 0.0
+            if self.rpm:
+                self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+                if self._requests < 1:
+                    wait = (1 - self._requests) * 60 / self.rpm
+            if self.tpm:
+                tokens = min(tokens, self.tpm)  # Oversized prompts wait for a full bucket
+                self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+                if self._tokens < tokens:
+                    wait = max(wait, (tokens - self._tokens) * 60 / self.tpm)
+
+            if wait == 0.0:
+                if self.rpm:
+                    self._requests -= 1
+                if self.tpm:
+                    self._tokens -= tokens
+            return wait
+
+    def acquire(self, tokens: int = 0) -> None:
+        """Block until a request of `tokens` fits under both limits."""
+        while (wait := self._reserve(tokens)) > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, tokens: int = 0) -> None:
+        """Async variant of acquire(); yields to the event loop while waiting."""
+        while (wait := self._reserve(tokens)) > 0:
+            await asyncio.sleep(wait)
@@ -1,11 +1,21 @@
 """Shared helpers for formatting transcripts."""
 
+import io
+import json
+import math
+from functools import lru_cache
+from pathlib import Path
 
+# Per-user cache for derived data (parsed config, etc.); safe to delete
+CACHE_DIR = Path.home() / ".cache" / "yt-comprehend"
+
+
+@lru_cache(maxsize=1024)
 def format_time(seconds: float) -> str:
     """Format seconds as MM:SS or HH:MM:SS."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
+    # Interval headers repeat the same boundaries, hence the cache
+    minutes, secs = divmod(math.floor(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
 
     if hours > 0:
         return f"{hours:02d}:{minutes:02d}:{secs:02d}"
@@ -21,7 +31,8 @@ def group_segments_by_interval(
     """Group timed segments into N-second interval blocks.
 
     Args:
-        segments: Iterable of objects with `.start` (float) and `.text` (str)
+        segments: Iterable of objects with `.start` (float) and `.text` (str),
+            or columnar segments exposing `.starts` / `.texts`
         interval: Seconds per block
         end_time: Total duration for the final label, or None for "end"
         bold: Wrap the timestamp header in markdown bold
@@ -29,38 +40,71 @@ def group_segments_by_interval(
     Returns:
         Text grouped under `[MM:SS - MM:SS]` headers
     """
-    segments = list(segments)
-    if not segments:
+    import numpy as np
+
+    if hasattr(segments, "starts"):
+        # Columnar segments (SegmentColumns): use the arrays directly
+        texts = [text.strip() for text in segments.texts]
+        starts = np.asarray(segments.starts, dtype=np.float64)
+    else:
+        segments = list(segments)
+        if segments and hasattr(segments[0], "start"):
+            # Segment dataclasses: plain attribute access, no per-item defaults
+            texts = [seg.text.strip() for seg in segments]
+            starts = np.fromiter(
+                (seg.start for seg in segments), dtype=np.float64, count=len(segments)
+            )
+        else:
+            texts = [getattr(seg, "text", str(seg)).strip() for seg in segments]
+            starts = np.fromiter(
+                (getattr(seg, "start", 0) for seg in segments), dtype=np.float64, count=len(segments)
+            )
+    if not texts:
         return ""
 
     def header(start: float, end_label: str) -> str:
         text = f"[{format_time(start)} - {end_label}]"
         return f"**{text}**" if bold else text
 
-    lines = []
-    current_interval_start = 0
-    current_texts = []
+    buckets = (starts // interval).astype(np.int64)
+
+    # A new block opens where a segment lands past the furthest interval seen
+    # so far; the first block always opens at 0
+    buckets[0] = 0
+    reached = np.maximum.accumulate(np.maximum(buckets, 0))
+    breaks = (np.flatnonzero(buckets[1:] > reached[:-1]) + 1).tolist()
+
+    block_starts = [0, *(buckets[breaks] * interval).tolist()]
+    bounds = [0, *breaks, len(texts)]
+    last = len(block_starts) - 1
+
+    out = io.StringIO()
+    for i, block_start in enumerate(block_starts):
+        if i < last:
+            out.write(header(block_start, format_time(block_start + interval)))
+        else:
+            out.write(header(block_start, format_time(end_time) if end_time else "end"))
+        out.write("\n")
+        out.write(" ".join(texts[bounds[i]:bounds[i + 1]]))
+        if i < last:
+            out.write("\n\n")
+
+    return out.getvalue()
 
-    for seg in segments:
-        start = getattr(seg, "start", 0)
-        text = getattr(seg, "text", str(seg)).strip()
 
-        interval_num = int(start // interval)
-        expected_start = interval_num * interval
+class SilentLogger:
+    """Swallow yt-dlp's own output when it runs in-process."""
 
-        if expected_start > current_interval_start and current_texts:
-            end = current_interval_start + interval
-            lines.append(header(current_interval_start, format_time(end)))
-            lines.append(" ".join(current_texts))
-            lines.append("")
-            current_texts = []
-            current_interval_start = expected_start
+    def debug(self, msg):
+        pass
 
-        current_texts.append(text)
+    info = warning = error = debug
 
-    if current_texts:
-        end_label = format_time(end_time) if end_time else "end"
-        lines.append(header(current_interval_start, end_label))
-        lines.append(" ".join(current_texts))
 
-    return "\n".join(lines)
+def read_info_title(info_path: Path) -> str | None:
+    """Read the video title from a yt-dlp `.info.json` file, if present."""
+    try:
+        with open(info_path, encoding="utf-8") as f:
+            return json.load(f).get("title") or None
+    except (OSError, ValueError):
+        return None
@@ -1,9 +1,19 @@
 #!/usr/bin/env python3
 """Quick test script to verify YT-Comprehend setup."""
 
+import importlib.util
 import sys
 from pathlib import Path
 
+
+def _can_import(module: str) -> bool:
+    """True if `module` is installed; located without importing it."""
+    try:
+        return importlib.util.find_spec(module) is not None
+    except (ImportError, ValueError):
+        return False  # Parent package (e.g. google for google.genai) missing
+
+
 def check_dependencies():
     """Check that required dependencies are installed."""
     print("Checking dependencies...\n")
@@ -22,26 +32,27 @@ def check_dependencies():
     optional = {
         "scenedetect": "scenedetect[opencv]",
         "paddleocr": "paddleocr",
-        "imagededup": "imagededup",
     }
     
     missing_required = []
     missing_optional = []
     
+    # Located rather than imported: heavy packages (faster_whisper, paddleocr)
+    # would otherwise spend seconds loading native libraries just to be found
+    importable = {module: _can_import(module) for module in [*required, *optional]}
+
     for module, package in required.items():
-        try:
-            __import__(module)
+        if importable[module]:
             print(f"  ✓ {package}")
-        except ImportError:
+        else:
             print(f"  ✗ {package} [REQUIRED]")
             missing_required.append(package)
     
     print("\nOptional (Tier 3 visual analysis):")
     for module, package in optional.items():
-        try:
-            __import__(module)
+        if importable[module]:
             print(f"  ✓ {package}")
-        except ImportError:
+        else:
             print(f"  ○ {package} [not installed]")
             missing_optional.append(package)
     